@@ -1,6 +1,6 @@
 import streamlit as st
-import folium
-from streamlit_folium import st_folium
+import streamlit.components.v1 as components
+from utils.home_map import load_home_map_html
 
 # Page configuration
 st.set_page_config(
@@ -11,7 +11,7 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
+CUSTOM_CSS = """
     <style>
     .main-header {
         font-size: 3rem;
@@ -42,7 +42,22 @@ st.markdown("""
         border-radius: 5px;
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+
+@st.cache_resource
+def _inject_css():
+    """
+    Emit the page stylesheet once per server process.
+
+    Streamlit replays the cached markdown element on later reruns, so the
+    styles stay applied without re-executing the call.
+    """
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+    return True
+
+
+_inject_css()
 
 # Main content
 st.markdown('<p class="main-header">🌍 Sulaimani Sustainable Growth</p>', unsafe_allow_html=True)
@@ -109,73 +124,88 @@ with col2:
 st.markdown("---")
 st.subheader("📍 Sulaimani City Overview")
 
-# Create base map (you can add overlays once data is ready)
-m = folium.Map(
-    location=[35.5608, 45.4347],  # Sulaimani coordinates
-    zoom_start=12,
-    tiles='OpenStreetMap'
-)
 
-# Add satellite imagery option
-folium.TileLayer(
-    tiles='https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}',
-    attr='Esri',
-    name='Satellite',
-    overlay=False,
-    control=True
-).add_to(m)
-
-# Add marker for city center
-folium.Marker(
-    [35.5608, 45.4347],
-    popup="Sulaimani City Center",
-    tooltip="Click for more info",
-    icon=folium.Icon(color='blue', icon='info-sign')
-).add_to(m)
-
-# Layer control
-folium.LayerControl().add_to(m)
+@st.cache_resource
+def build_home_map_html():
+    """
+    Load the overview map HTML once per server process.
+
+    The map is prebuilt by build_home_map.py into assets/home_map.html and
+    embedded as static HTML rather than through st_folium, which would
+    round-trip every pan/zoom to Python and trigger a rerun.
+    """
+    return load_home_map_html()
+
+
+@st.fragment
+def render_map():
+    """Map section; reruns in isolation from the rest of the page."""
+    components.html(build_home_map_html(), width=1400, height=500)
+
 
 # Display map
-st_folium(m, width=1400, height=500)
+render_map()
 
 # Key Statistics (placeholder - will be populated with real data)
 st.markdown("---")
 st.subheader("📈 Key Insights at a Glance")
 
-col1, col2, col3, col4 = st.columns(4)
-
-with col1:
-    st.metric(
-        label="🌡️ Avg Temperature Increase",
-        value="2.3°C",
-        delta="Since 2005",
-        delta_color="inverse"
-    )
-
-with col2:
-    st.metric(
-        label="🏙️ Urban Expansion",
-        value="45%",
-        delta="20 years",
-        delta_color="normal"
-    )
 
-with col3:
-    st.metric(
-        label="🌳 Green Space Loss",
-        value="-18%",
-        delta="Declining",
-        delta_color="inverse"
-    )
-
-with col4:
-    st.metric(
-        label="💨 Air Quality Days",
-        value="152",
-        delta="Unhealthy days/year",
-        delta_color="inverse"
-    )
+@st.cache_data(ttl=3600)
+def get_home_stats():
+    """
+    Headline values for the key statistics row.
+
+    Placeholders for now; once these are computed from the datasets the
+    hourly TTL keeps reruns from repeating the aggregations.
+    """
+    temp_increase = "2.3°C"
+    urban_expansion = "45%"
+    green_space_change = "-18%"
+    unhealthy_days = "152"
+    return temp_increase, urban_expansion, green_space_change, unhealthy_days
+
+
+@st.fragment
+def render_metrics():
+    """Key statistics section; reruns in isolation from the rest of the page."""
+    temp_increase, urban_expansion, green_space_change, unhealthy_days = get_home_stats()
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric(
+            label="🌡️ Avg Temperature Increase",
+            value=temp_increase,
+            delta="Since 2005",
+            delta_color="inverse"
+        )
+
+    with col2:
+        st.metric(
+            label="🏙️ Urban Expansion",
+            value=urban_expansion,
+            delta="20 years",
+            delta_color="normal"
+        )
+
+    with col3:
+        st.metric(
+            label="🌳 Green Space Loss",
+            value=green_space_change,
+            delta="Declining",
+            delta_color="inverse"
+        )
+
+    with col4:
+        st.metric(
+            label="💨 Air Quality Days",
+            value=unhealthy_days,
+            delta="Unhealthy days/year",
+            delta_color="inverse"
+        )
+
+
+render_metrics()
 
 # Navigation guide
 st.markdown("---")
@@ -0,0 +1,22 @@
+"""
+Prebuild the Home page overview map as static HTML
+
+Run once (or in CI) after changing utils/home_map.py so Home.py can embed
+the saved file instead of rendering the folium map at startup.
+"""
+
+from utils.home_map import HOME_MAP_HTML, create_home_map
+
+
+def build_home_map():
+    """Render the overview map and save it to assets/home_map.html"""
+    print("🗺️ Building Home page map...")
+
+    HOME_MAP_HTML.parent.mkdir(parents=True, exist_ok=True)
+    create_home_map().save(str(HOME_MAP_HTML))
+
+    print(f"✅ Saved {HOME_MAP_HTML} ({HOME_MAP_HTML.stat().st_size / 1024:.1f} KB)")
+
+
+if __name__ == "__main__":
+    build_home_map()
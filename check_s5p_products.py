@@ -3,14 +3,206 @@ Check available Sentinel-5P products in S5P-PAL Data Portal API
 Identifies all pollutants and data products available for air quality monitoring
 """
 
+import argparse
+import hashlib
+import pickle
+import time
 import requests
-import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson parses STAC payloads several times faster; fall back to the stdlib
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    import json
+    json_loads = json.loads
 
 # S5P-PAL API endpoint
 L2_CATALOG = "https://data-portal.s5p-pal.com/api/s5p-l2"
 
-def check_available_products():
+# Static catalog of TROPOMI products, kept as data rather than code
+KNOWN_PRODUCTS_FILE = Path(__file__).parent / 's5p_products.json'
+
+# On-disk copies of catalog responses, revalidated with ETag/Last-Modified
+CACHE_DIR = Path('.cache') / 's5p_pal'
+
+# Parsed catalog summary shared across processes for CATALOG_TTL_SECONDS
+CATALOG_CACHE_DIR = Path.home() / '.cache' / 'nasa_sulaimani'
+CATALOG_TTL_SECONDS = 3600
+
+# (connect, read) timeouts in seconds
+REQUEST_TIMEOUT = (5, 30)
+
+# Shared session so every call reuses one pooled keep-alive connection
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+))
+SESSION.headers.update({
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip",
+    "User-Agent": "nasa_sulaimani/1.0"
+})
+
+def _json(response):
+    """
+    Decode a JSON response body with orjson when it is installed
+    """
+    return json_loads(response.content)
+
+def _cached_get_json(url, params=None):
+    """
+    GET a JSON document, revalidating a cached copy with a conditional request
+
+    When the server answers 304 Not Modified the body stored from the
+    previous run is reused, so unchanged catalog metadata costs one
+    header-only round-trip.
+    """
+    cache_key = hashlib.sha1(f"{url}?{sorted((params or {}).items())}".encode()).hexdigest()
+    body_path = CACHE_DIR / f"{cache_key}.json"
+    validators_path = CACHE_DIR / f"{cache_key}.validators"
+    
+    headers = {}
+    if body_path.exists() and validators_path.exists():
+        etag, last_modified = validators_path.read_text().split('\n', 1)
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+    
+    response = SESSION.get(url, params=params, headers=headers, timeout=REQUEST_TIMEOUT)
+    if response.status_code == 304:
+        return json_loads(body_path.read_bytes())
+    response.raise_for_status()
+    
+    etag = response.headers.get('ETag', '')
+    last_modified = response.headers.get('Last-Modified', '')
+    if etag or last_modified:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        body_path.write_bytes(response.content)
+        validators_path.write_text(f"{etag}\n{last_modified}")
+    
+    return _json(response)
+
+def _fetch_catalog_uncached(sample_limit):
+    """
+    Fetch the S5P-PAL catalog, its collections and a sample search page
+    """
+    # Get catalog information
+    catalog_info = _cached_get_json(L2_CATALOG)
+    
+    # Check if there's a collections endpoint
+    collections_url = None
+    for link in catalog_info.get('links', []):
+        if link.get('rel') == 'data' or 'collection' in link.get('href', ''):
+            collections_url = link.get('href')
+            break
+    
+    # Check search endpoint for available products
+    search_url = None
+    for link in catalog_info.get('links', []):
+        if link.get('rel') == 'search':
+            search_url = link.get('href')
+            break
+    
+    # Try to get a small sample of available products, asking the server
+    # (STAC fields extension) to return only the properties printed below
+    search_params = {
+        'limit': sample_limit,
+        'datetime': '2024-01-01/2024-01-31',
+        'fields': 'id,properties.s5p:file_type,properties.s5p:processing_mode,properties.datetime'
+    }
+    
+    # The collections and search requests are independent, so overlap them
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        collections_future = None
+        search_future = None
+        if collections_url:
+            collections_future = executor.submit(_cached_get_json, collections_url)
+        if search_url:
+            search_future = executor.submit(_cached_get_json, search_url, search_params)
+    
+    return {
+        'catalog': catalog_info,
+        'collections_url': collections_url,
+        'collections': collections_future.result() if collections_future else None,
+        'search_url': search_url,
+        'search': search_future.result() if search_future else None,
+        'sample_limit': sample_limit
+    }
+
+@lru_cache(maxsize=4)
+def _fetch_catalog(sample_limit, ttl_bucket):
+    """
+    In-process memo for fetch_catalog; ttl_bucket expires entries each TTL window
+    """
+    cache_file = CATALOG_CACHE_DIR / f"s5p_catalog_{sample_limit}.pkl"
+    if cache_file.exists() and time.time() - cache_file.stat().st_mtime < CATALOG_TTL_SECONDS:
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    
+    catalog = _fetch_catalog_uncached(sample_limit)
+    CATALOG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with open(cache_file, 'wb') as f:
+        pickle.dump(catalog, f)
+    return catalog
+
+def fetch_catalog(sample_limit=3):
+    """
+    Return S5P-PAL catalog metadata, cached in memory and on disk for an hour
+
+    The pickle's mtime serves as the TTL sentinel across processes, so
+    scripts that probe the catalog repeatedly only hit the network once
+    per TTL window.
+    """
+    return _fetch_catalog(sample_limit, int(time.time() // CATALOG_TTL_SECONDS))
+
+def print_catalog(catalog):
+    """
+    Print the catalog summary returned by fetch_catalog
+    """
+    catalog_info = catalog['catalog']
+    print("📡 Catalog Information:")
+    print(f"   Title: {catalog_info.get('title', 'N/A')}")
+    print(f"   Description: {catalog_info.get('description', 'N/A')}")
+    
+    collections_data = catalog['collections']
+    if collections_data is not None:
+        print(f"\n📂 Collections URL: {catalog['collections_url']}")
+        
+        print("\n🏷️ Available Collections/Products:")
+        if 'collections' in collections_data:
+            for collection in collections_data['collections']:
+                print(f"   • {collection.get('id', 'Unknown ID')}")
+                print(f"     Title: {collection.get('title', 'N/A')}")
+                print(f"     Description: {collection.get('description', 'N/A')[:100]}...")
+                print()
+    
+    search_data = catalog['search']
+    if search_data is not None:
+        print(f"\n🔍 Search URL: {catalog['search_url']}")
+        
+        print(f"\n📊 Sample Products (showing first {catalog['sample_limit']}):")
+        if 'features' in search_data:
+            for feature in search_data['features']:
+                product_id = feature.get('id', 'Unknown')
+                properties = feature.get('properties', {})
+                
+                print(f"   • Product: {product_id}")
+                print(f"     Type: {properties.get('s5p:file_type', 'N/A')}")
+                print(f"     Processing Mode: {properties.get('s5p:processing_mode', 'N/A')}")
+                print(f"     Date: {properties.get('datetime', 'N/A')}")
+                print()
+
+def check_available_products(sample_limit=3):
     """
     Check what Sentinel-5P products are available in the S5P-PAL catalog
     """
@@ -18,70 +210,19 @@ def check_available_products():
     print("=" * 60)
     
     try:
-        # Get catalog information
-        response = requests.get(L2_CATALOG, timeout=30)
-        catalog_info = response.json()
-        
-        print("📡 Catalog Information:")
-        print(f"   Title: {catalog_info.get('title', 'N/A')}")
-        print(f"   Description: {catalog_info.get('description', 'N/A')}")
-        
-        # Check if there's a collections endpoint
-        collections_url = None
-        for link in catalog_info.get('links', []):
-            if link.get('rel') == 'data' or 'collection' in link.get('href', ''):
-                collections_url = link.get('href')
-                break
-        
-        if collections_url:
-            print(f"\n📂 Collections URL: {collections_url}")
-            collections_response = requests.get(collections_url, timeout=30)
-            collections_data = collections_response.json()
-            
-            print("\n🏷️ Available Collections/Products:")
-            if 'collections' in collections_data:
-                for collection in collections_data['collections']:
-                    print(f"   • {collection.get('id', 'Unknown ID')}")
-                    print(f"     Title: {collection.get('title', 'N/A')}")
-                    print(f"     Description: {collection.get('description', 'N/A')[:100]}...")
-                    print()
-        
-        # Check search endpoint for available products
-        search_url = None
-        for link in catalog_info.get('links', []):
-            if link.get('rel') == 'search':
-                search_url = link.get('href')
-                break
-        
-        if search_url:
-            print(f"\n🔍 Search URL: {search_url}")
-            
-            # Try to get a sample of available products
-            search_params = {
-                'limit': 10,
-                'datetime': '2024-01-01/2024-01-31'
-            }
-            
-            search_response = requests.get(search_url, params=search_params, timeout=30)
-            search_data = search_response.json()
-            
-            print(f"\n📊 Sample Products (showing first 10):")
-            if 'features' in search_data:
-                for feature in search_data['features']:
-                    product_id = feature.get('id', 'Unknown')
-                    properties = feature.get('properties', {})
-                    
-                    print(f"   • Product: {product_id}")
-                    print(f"     Type: {properties.get('s5p:file_type', 'N/A')}")
-                    print(f"     Processing Mode: {properties.get('s5p:processing_mode', 'N/A')}")
-                    print(f"     Date: {properties.get('datetime', 'N/A')}")
-                    print()
-        
+        print_catalog(fetch_catalog(sample_limit))
     except requests.exceptions.RequestException as e:
         print(f"❌ API Request Error: {e}")
     except Exception as e:
         print(f"❌ Error: {e}")
 
+@lru_cache(maxsize=1)
+def load_known_products():
+    """
+    Load the known Sentinel-5P product descriptions from s5p_products.json
+    """
+    return json_loads(KNOWN_PRODUCTS_FILE.read_bytes())
+
 def check_known_s5p_products():
     """
     List known Sentinel-5P TROPOMI products based on documentation
@@ -89,56 +230,7 @@ def check_known_s5p_products():
     print("\n🔬 Known Sentinel-5P TROPOMI Products:")
     print("=" * 50)
     
-    products = {
-        "L2__NO2___": {
-            "name": "Nitrogen Dioxide (NO₂)",
-            "description": "Tropospheric NO₂ column density",
-            "units": "mol/m²",
-            "applications": ["Air quality", "Traffic monitoring", "Industrial emissions"]
-        },
-        "L2__SO2___": {
-            "name": "Sulfur Dioxide (SO₂)",
-            "description": "Total SO₂ column density",
-            "units": "mol/m²",
-            "applications": ["Volcanic emissions", "Industrial pollution", "Shipping"]
-        },
-        "L2__O3____": {
-            "name": "Ozone (O₃)",
-            "description": "Total ozone column",
-            "units": "DU (Dobson Units)",
-            "applications": ["Stratospheric ozone", "Air quality"]
-        },
-        "L2__CO____": {
-            "name": "Carbon Monoxide (CO)",
-            "description": "Total CO column density",
-            "units": "mol/m²",
-            "applications": ["Pollution monitoring", "Fire detection", "Transport emissions"]
-        },
-        "L2__CH4___": {
-            "name": "Methane (CH₄)",
-            "description": "Total CH₄ column density",
-            "units": "mol/m²",
-            "applications": ["Greenhouse gas monitoring", "Leak detection"]
-        },
-        "L2__HCHO__": {
-            "name": "Formaldehyde (HCHO)",
-            "description": "Tropospheric HCHO column density",
-            "units": "mol/m²",
-            "applications": ["VOC emissions", "Biogenic emissions"]
-        },
-        "L2__CLOUD_": {
-            "name": "Cloud Properties",
-            "description": "Cloud fraction and pressure",
-            "units": "Various",
-            "applications": ["Atmospheric correction", "Weather analysis"]
-        },
-        "L2__AER_AI": {
-            "name": "Aerosol Index",
-            "description": "UV Aerosol Index",
-            "units": "Dimensionless",
-            "applications": ["Dust storms", "Smoke detection", "Air quality"]
-        }
-    }
+    products = load_known_products()
     
     for product_code, info in products.items():
         print(f"🧪 {product_code}")
@@ -202,7 +294,12 @@ def create_multi_pollutant_downloader():
     print("   4. Update Air Quality page dropdown options")
 
 if __name__ == "__main__":
-    check_available_products()
+    parser = argparse.ArgumentParser(description='Check Sentinel-5P products available via S5P-PAL')
+    parser.add_argument('--verbose', action='store_true',
+                       help='Fetch a larger sample of products from the search endpoint')
+    args = parser.parse_args()
+    
+    check_available_products(sample_limit=10 if args.verbose else 3)
     check_known_s5p_products()
     check_air_quality_relevance()
     create_multi_pollutant_downloader()
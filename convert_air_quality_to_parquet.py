@@ -0,0 +1,71 @@
+"""
+Convert the gridded air quality CSVs to compact Parquet copies
+
+Stores lat/lon as float32 and the repeated date/category strings as
+categoricals.
+"""
+
+import pandas as pd
+from pathlib import Path
+
+DATA_DIR = Path('data')
+
+# Gridded air quality outputs read by analyze_air_quality_system.py
+AIR_QUALITY_FILES = [
+    'air_quality_combined_grid.csv',
+    'composite_air_quality_index.csv',
+    'air_quality_no2_interpolated.csv',
+    'air_quality_so2_interpolated.csv',
+    'air_quality_co_interpolated.csv',
+    'air_quality_o3_interpolated.csv',
+    'air_quality_hcho_interpolated.csv',
+    'air_quality_aer_ai_interpolated.csv',
+    'population_density.csv'
+]
+
+CATEGORICAL_COLUMNS = ['aqi_category', 'aqi_color', 'pollutant', 'units']
+
+
+def to_compact_frame(df):
+    """
+    Downcast coordinates and dictionary-encode repeated string columns
+    """
+    df = df.astype({col: 'float32' for col in ('lat', 'lon') if col in df.columns})
+    if 'date' in df.columns:
+        # ISO dates sort lexically, so an ordered categorical keeps min/max working
+        df['date'] = df['date'].astype('category').cat.as_ordered()
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    return df
+
+
+def convert_csv_to_parquet(csv_path):
+    """
+    Write a Parquet copy next to ``csv_path`` and return its path
+    """
+    df = to_compact_frame(pd.read_csv(csv_path))
+    parquet_path = csv_path.with_suffix('.parquet')
+    df.to_parquet(parquet_path, index=False)
+    return parquet_path
+
+
+def main():
+    print("📦 Converting air quality CSVs to Parquet...")
+
+    for filename in AIR_QUALITY_FILES:
+        csv_path = DATA_DIR / filename
+        if not csv_path.exists():
+            print(f"   ⚠️ {filename}: Not found, skipping")
+            continue
+
+        parquet_path = convert_csv_to_parquet(csv_path)
+        csv_size = csv_path.stat().st_size / 1024 / 1024
+        parquet_size = parquet_path.stat().st_size / 1024 / 1024
+        print(f"   ✅ {filename}: {csv_size:.1f} MB → {parquet_size:.1f} MB")
+
+    print("📊 Parquet conversion complete!")
+
+
+if __name__ == "__main__":
+    main()
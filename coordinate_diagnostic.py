@@ -2,16 +2,33 @@
 """
 Quick diagnostic script to check coordinate system
 """
+import os
 import pandas as pd
 import numpy as np
-from shapely.geometry import Point, Polygon
+import shapely
+from shapely.geometry import Polygon
 
 print("🔍 COORDINATE SYSTEM DIAGNOSTIC")
 print("="*50)
 
+TOPO_CSV = 'data_solution/enhanced_topography_detailed.csv'
+TOPO_FEATHER = 'data_solution/enhanced_topography_detailed.feather'
+
+def load_topography_coordinates():
+    """
+    Load topography lat/lon, reusing a Feather copy while it is newer than the CSV
+    """
+    if os.path.exists(TOPO_FEATHER) and os.path.getmtime(TOPO_FEATHER) >= os.path.getmtime(TOPO_CSV):
+        return pd.read_feather(TOPO_FEATHER, columns=['lat', 'lon'])
+    
+    # Only coordinates are inspected; float64 keeps the 6-decimal printout exact
+    df = pd.read_csv(TOPO_CSV, usecols=['lat', 'lon'], dtype={'lat': 'float64', 'lon': 'float64'})
+    df.to_feather(TOPO_FEATHER)
+    return df
+
 # Load sample data to check coordinate ranges
 try:
-    topo_data = pd.read_csv('data_solution/enhanced_topography_detailed.csv')
+    topo_data = load_topography_coordinates()
     print(f"✅ Loaded topography data: {len(topo_data)} points")
     print(f"📊 Latitude range: {topo_data['lat'].min():.6f} to {topo_data['lat'].max():.6f}")
     print(f"📊 Longitude range: {topo_data['lon'].min():.6f} to {topo_data['lon'].max():.6f}")
@@ -41,16 +58,18 @@ try:
     print(f"\n🧪 TESTING POLYGON FORMATS")
     print(f"Test center: {sulaimani_lat:.6f}°N, {sulaimani_lon:.6f}°E")
     
+    # Coordinate arrays and buffered polygons are loop-invariant: build them once
+    lons = topo_data['lon'].to_numpy()
+    lats = topo_data['lat'].to_numpy()
+    
     # Test Format 1: st_folium [lat, lon] -> shapely [lon, lat] 
     try:
         shapely_coords1 = [(coord[1], coord[0]) for coord in coords_format1]
         polygon1 = Polygon(shapely_coords1)
         
-        points_found = 0
-        for _, row in topo_data.iterrows():
-            point = Point(row['lon'], row['lat'])
-            if polygon1.buffer(0.001).contains(point):
-                points_found += 1
+        buffered1 = polygon1.buffer(0.001)
+        inside = shapely.contains_xy(buffered1, lons, lats)
+        points_found = int(inside.sum())
         
         print(f"🔸 Format 1 [lat,lon]->shapely[lon,lat]: {points_found} points found")
         print(f"   Polygon bounds: {polygon1.bounds}")
@@ -62,11 +81,9 @@ try:
     try:
         polygon2 = Polygon(coords_format2)
         
-        points_found = 0
-        for _, row in topo_data.iterrows():
-            point = Point(row['lon'], row['lat'])
-            if polygon2.buffer(0.001).contains(point):
-                points_found += 1
+        buffered2 = polygon2.buffer(0.001)
+        inside = shapely.contains_xy(buffered2, lons, lats)
+        points_found = int(inside.sum())
         
         print(f"🔸 Format 2 direct [lon,lat]: {points_found} points found")
         print(f"   Polygon bounds: {polygon2.bounds}")
@@ -76,12 +93,15 @@ try:
 
     # Show sample data points near center
     print(f"\n📍 SAMPLE DATA POINTS NEAR CENTER:")
-    distances = np.sqrt((topo_data['lat'] - sulaimani_lat)**2 + (topo_data['lon'] - sulaimani_lon)**2)
-    closest_5 = topo_data.iloc[distances.argsort()[:5]]
+    # Rank on squared distance (same order, no sqrt) with O(N) partial selection
+    dist_sq = (lats - sulaimani_lat)**2 + (lons - sulaimani_lon)**2
+    k = min(5, len(dist_sq))
+    closest_idx = np.argpartition(dist_sq, k - 1)[:k]
+    closest_idx = closest_idx[np.argsort(dist_sq[closest_idx])]
+    closest_5 = topo_data.iloc[closest_idx]
     
-    for i, (_, row) in enumerate(closest_5.iterrows()):
-        dist = distances.iloc[row.name]
-        print(f"   {i+1}. Lat: {row['lat']:.6f}, Lon: {row['lon']:.6f}, Dist: {dist:.6f}°")
+    for i, (row, d2) in enumerate(zip(closest_5.itertuples(index=False), dist_sq[closest_idx])):
+        print(f"   {i+1}. Lat: {row.lat:.6f}, Lon: {row.lon:.6f}, Dist: {np.sqrt(d2):.6f}°")
 
 except Exception as e:
     print(f"❌ Error loading data: {e}")
@@ -3,14 +3,48 @@ Create consistent spatial grid for all air quality pollutants with interpolation
 This ensures all 6 pollutants are measured at the same locations for meaningful comparison
 """
 
+import argparse
 import pandas as pd
 import numpy as np
-from scipy.interpolate import griddata
-from scipy.spatial import distance_matrix
 import os
 from datetime import datetime, timedelta
 from utils.data_loader import get_sulaimani_bounds
 
+# Generated values are float32; four decimals (~10 m for coordinates) is
+# finer than the grid spacing and the synthetic noise
+CSV_FLOAT_FORMAT = '%.4f'
+
+# Numba fuses the source summation into one compiled loop; fall back to NumPy
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+def _source_field_numpy(lat, lon, src_lat, src_lon, strength, inv_r2):
+    """
+    Sum Gaussian source contributions at each point with NumPy broadcasting
+    """
+    d2 = (lat[None, :] - src_lat[:, None])**2 + (lon[None, :] - src_lon[:, None])**2
+    return (strength[:, None] * np.exp(-d2 * inv_r2[:, None])).sum(axis=0)
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _source_field(lat, lon, src_lat, src_lon, strength, inv_r2):
+        """
+        Sum Gaussian source contributions at each point in a single pass
+        """
+        out = np.empty_like(lat)
+        for i in prange(lat.shape[0]):
+            total = 0.0
+            for k in range(src_lat.shape[0]):
+                dx = lat[i] - src_lat[k]
+                dy = lon[i] - src_lon[k]
+                total += strength[k] * np.exp(-(dx * dx + dy * dy) * inv_r2[k])
+            out[i] = total
+        return out
+else:
+    _source_field = _source_field_numpy
+
 def create_consistent_measurement_grid():
     """
     Create a consistent spatial grid covering Sulaimani for all pollutants
@@ -30,40 +64,49 @@ def create_consistent_measurement_grid():
     n_points_lat = 40
     n_points_lon = 40
     
-    lats = np.linspace(min_lat, max_lat, n_points_lat)
-    lons = np.linspace(min_lon, max_lon, n_points_lon)
+    # float32 keeps sub-metre precision at this latitude with half the memory
+    lats = np.linspace(min_lat, max_lat, n_points_lat, dtype=np.float32)
+    lons = np.linspace(min_lon, max_lon, n_points_lon, dtype=np.float32)
     
-    # Create meshgrid
-    lat_grid, lon_grid = np.meshgrid(lats, lons)
+    # Flattened coordinate pairs without the 2D meshgrid intermediates
+    # (same ordering as meshgrid(lats, lons).flatten(): latitude varies fastest)
+    lat_flat = np.tile(lats, n_points_lon)
+    lon_flat = np.repeat(lons, n_points_lat)
     
-    # Flatten to create coordinate pairs
     grid_coords = pd.DataFrame({
-        'lat': lat_grid.flatten(),
-        'lon': lon_grid.flatten()
+        'lat': lat_flat,
+        'lon': lon_flat,
+        # Add grid_id for tracking
+        'grid_id': np.arange(len(lat_flat), dtype=np.int32)
     })
     
-    # Add grid_id for tracking
-    grid_coords['grid_id'] = range(len(grid_coords))
-    
     print(f"   ✅ Created {len(grid_coords)} grid points covering Sulaimani")
     print(f"   📐 Grid: {n_points_lat}×{n_points_lon} regular spacing")
     print(f"   🌍 Coverage: {min_lat:.3f}°N to {max_lat:.3f}°N, {min_lon:.3f}°E to {max_lon:.3f}°E")
     
     return grid_coords
 
-def interpolate_pollutant_data(original_data, target_grid, pollutant_name):
+def interpolate_pollutant_field(original_data, target_grid, pollutant_name, rng=None):
     """
-    Interpolate existing pollutant data onto consistent grid using spatial interpolation
+    Interpolate existing pollutant data onto consistent grid as a dates × grid array
+    
+    The surface comes from a Gaussian emission-source model evaluated at each
+    grid point; original_data supplies the measurement dates. The scattered
+    values are simulated placeholders, so they are not gridded directly
+    (that would replace the modelled magnitudes, e.g. ~260 DU for O3).
     
     Args:
         original_data (pd.DataFrame): Original scattered measurements
         target_grid (pd.DataFrame): Target regular grid
         pollutant_name (str): Name of pollutant for realistic modeling
+        rng (np.random.Generator): Random generator for measurement noise
         
     Returns:
-        pd.DataFrame: Interpolated data on regular grid
+        tuple: (dates, values) where values is a float32 array of shape
+        (len(dates), len(target_grid))
     """
-    print(f"   📊 Interpolating {pollutant_name} data onto regular grid...")
+    if rng is None:
+        rng = np.random.default_rng()
     
     # Define pollution source models for realistic spatial patterns
     center_lat, center_lon = 35.5608, 45.4347  # Sulaimani city center
@@ -106,79 +149,186 @@ def interpolate_pollutant_data(original_data, target_grid, pollutant_name):
     # Get sources for this pollutant
     sources = pollutant_sources.get(pollutant_name, pollutant_sources['NO2'])
     
-    interpolated_data = []
+    # Source parameters as float32 arrays (the grid's precision); 1/r² is
+    # precomputed to keep division out of the kernel
+    src_lat = np.array([source['lat'] for source in sources], dtype=np.float32)
+    src_lon = np.array([source['lon'] for source in sources], dtype=np.float32)
+    strength = np.array([source['strength'] for source in sources], dtype=np.float32)
+    inv_r2 = 1.0 / np.array([source['radius'] for source in sources], dtype=np.float32)**2
+    
+    lat_arr = target_grid['lat'].to_numpy(dtype=np.float32)
+    lon_arr = target_grid['lon'].to_numpy(dtype=np.float32)
+    
+    # Background level and noise for this pollutant
+    if pollutant_name == 'O3':
+        background = 260  # DU
+        noise_scale = 15
+    elif pollutant_name == 'CO':
+        background = 0.3  # mg/m³
+        noise_scale = 0.2
+    elif pollutant_name == 'AER_AI':
+        background = 0.5  # AI
+        noise_scale = 0.3
+    else:
+        background = 5    # µg/m³
+        noise_scale = 3
+    
+    # Create base field from source model: Gaussian decay with distance.
+    # Sources are static, so the field is the same for every date
+    source_field = _source_field(lat_arr, lon_arr, src_lat, src_lon, strength, inv_r2)
     
     # Process each date in original data
     dates = original_data['date'].unique()
+    values = np.empty((len(dates), len(target_grid)), dtype=np.float32)
     
-    for date in dates:
-        daily_data = original_data[original_data['date'] == date].copy()
-        
-        # Create base field from source model
-        base_values = np.zeros(len(target_grid))
-        
-        for i, (_, grid_point) in enumerate(target_grid.iterrows()):
-            grid_lat, grid_lon = grid_point['lat'], grid_point['lon']
-            total_contribution = 0
-            
-            # Calculate contribution from each source
-            for source in sources:
-                distance = np.sqrt((grid_lat - source['lat'])**2 + (grid_lon - source['lon'])**2)
-                # Gaussian decay with distance
-                contribution = source['strength'] * np.exp(-(distance / source['radius'])**2)
-                total_contribution += contribution
-            
-            # Add background level and some noise
-            if pollutant_name == 'O3':
-                background = 260  # DU
-                noise_scale = 15
-            elif pollutant_name == 'CO':
-                background = 0.3  # mg/m³
-                noise_scale = 0.2
-            elif pollutant_name == 'AER_AI':
-                background = 0.5  # AI
-                noise_scale = 0.3
-            else:
-                background = 5    # µg/m³
-                noise_scale = 3
-            
-            base_values[i] = total_contribution + background + np.random.normal(0, noise_scale)
+    for date_idx, date in enumerate(dates):
+        # Add background level and some noise, drawn once for the whole grid
+        noise = rng.normal(0.0, noise_scale, size=len(target_grid)).astype(np.float32)
+        base_values = source_field + background + noise
         
         # Ensure positive values and apply realistic constraints
         base_values = np.maximum(base_values, background * 0.1)
         
         # Add temporal variation (daily cycle, weather effects)
         time_variation = 1.0 + 0.3 * np.sin(2 * np.pi * (pd.Timestamp(date).dayofyear / 365.25))
-        base_values *= time_variation
+        values[date_idx] = base_values * time_variation
+    
+    return dates, values
+
+def measurement_index(dates, target_grid):
+    """
+    Date-major (date, lat, lon, grid_id) rows for every grid point on every date
+    
+    Args:
+        dates (array-like): Measurement dates
+        target_grid (pd.DataFrame): Grid with lat, lon and grid_id columns
+        
+    Returns:
+        pd.DataFrame: One row per (date, grid point), date stored as categorical
+    """
+    n_dates, n_grid = len(dates), len(target_grid)
+    return pd.DataFrame({
+        'date': pd.Categorical.from_codes(np.repeat(np.arange(n_dates, dtype=np.int32), n_grid), categories=dates),
+        'lat': np.tile(target_grid['lat'].to_numpy(), n_dates),
+        'lon': np.tile(target_grid['lon'].to_numpy(), n_dates),
+        'grid_id': np.tile(target_grid['grid_id'].to_numpy(), n_dates)
+    })
+
+def pollutant_frame(dates, values, target_grid, pollutant_name):
+    """
+    Lay out a dates × grid value array as one long-format row per measurement
+    
+    Args:
+        dates (array-like): Dates labelling the first axis of values
+        values (np.ndarray): Array of shape (len(dates), len(target_grid))
+        target_grid (pd.DataFrame): Grid the values were computed on
+        pollutant_name (str): Name of pollutant
+        
+    Returns:
+        pd.DataFrame: date, lat, lon, grid_id, value and pollutant columns
+    """
+    frame = measurement_index(dates, target_grid)
+    frame['value'] = values.reshape(-1)
+    frame['pollutant'] = pd.Categorical.from_codes(np.zeros(len(frame), dtype=np.int8), categories=[pollutant_name])
+    return frame
+
+def interpolate_pollutant_data(original_data, target_grid, pollutant_name, rng=None):
+    """
+    Interpolate existing pollutant data onto consistent grid using spatial interpolation
+    
+    Args:
+        original_data (pd.DataFrame): Original scattered measurements
+        target_grid (pd.DataFrame): Target regular grid
+        pollutant_name (str): Name of pollutant for realistic modeling
+        rng (np.random.Generator): Random generator for measurement noise
         
-        # Create interpolated dataset for this date
-        for i, (_, grid_point) in enumerate(target_grid.iterrows()):
-            interpolated_data.append({
-                'date': date,
-                'lat': grid_point['lat'],
-                'lon': grid_point['lon'],
-                'grid_id': grid_point['grid_id'],
-                'value': base_values[i],
-                'pollutant': pollutant_name
-            })
-    
-    result_df = pd.DataFrame(interpolated_data)
+    Returns:
+        pd.DataFrame: Interpolated data on regular grid
+    """
+    print(f"   📊 Interpolating {pollutant_name} data onto regular grid...")
+    
+    dates, values = interpolate_pollutant_field(original_data, target_grid, pollutant_name, rng)
+    result_df = pollutant_frame(dates, values, target_grid, pollutant_name)
     
     print(f"      ✅ Generated {len(result_df)} interpolated measurements")
     print(f"      📊 Value range: {result_df['value'].min():.2f} - {result_df['value'].max():.2f}")
     
     return result_df
 
-def create_consistent_air_quality_dataset():
+# Normalize each pollutant to 0-100 scale based on WHO guidelines
+AQI_WEIGHTS = {
+    'NO2': 0.25,    # High weight - direct health impact
+    'SO2': 0.20,    # High weight - respiratory effects  
+    'CO': 0.15,     # Medium weight - cardiovascular
+    'HCHO': 0.15,   # Medium weight - carcinogenic
+    'AER_AI': 0.15, # Medium weight - respiratory/visibility
+    'O3': 0.10      # Lower weight - beneficial in stratosphere
+}
+
+# Guidelines for normalization
+AQI_GUIDELINES = {
+    'NO2': 40.0,
+    'SO2': 20.0, 
+    'CO': 10.0,
+    'HCHO': 30.0,
+    'AER_AI': 2.0,
+    'O3': 300.0  # For O3, lower is worse (ozone depletion)
+}
+
+def composite_aqi_scores(values, pollutants):
+    """
+    Weighted 0-100 risk score over the last axis of a pollutant value array
+    
+    Args:
+        values (np.ndarray): Array of shape (..., len(pollutants)); NaN marks
+            a pollutant that was not measured
+        pollutants (list): Pollutant names in the order of the last axis
+        
+    Returns:
+        np.ndarray: Composite AQI score per measurement (NaN if none measured)
+    """
+    values = np.asarray(values, dtype=float)
+    guidelines = np.array([AQI_GUIDELINES[pollutant] for pollutant in pollutants])
+    weights = np.array([AQI_WEIGHTS[pollutant] for pollutant in pollutants])
+    
+    # Higher values are worse, capped at 100
+    risk = np.minimum(100, 100 * values / guidelines)
+    # For ozone, lower values are worse (ozone depletion concern):
+    # normalize to 0-100 and convert to risk scale (lower O3 = higher risk)
+    o3_idx = pollutants.index('O3')
+    risk[..., o3_idx] = 100 - np.clip(risk[..., o3_idx], 0, 100)
+    
+    # Weighted mean over the pollutants measured at each point
+    measured = ~np.isnan(values)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.nansum(weights * risk, axis=-1) / (weights * measured).sum(axis=-1)
+
+def create_consistent_air_quality_dataset(seed=42, save_individual=False):
     """
     Create consistent air quality dataset for all 6 pollutants on the same grid
+    
+    Args:
+        seed (int): Seed for the shared random generator, for reproducible output
+        save_individual (bool): Also write the per-pollutant
+            air_quality_*_interpolated.csv files (read by
+            analyze_air_quality_system.py); the combined grid is always written
     """
     print("🏭 Creating Consistent Multi-Pollutant Air Quality Dataset")
     print("=" * 65)
     
+    # One generator shared by every pollutant so a run is reproducible
+    rng = np.random.default_rng(seed)
+    
     # Create consistent measurement grid
     grid = create_consistent_measurement_grid()
     
+    # Sulaimani bounds for the mock scattered measurements (constant across
+    # pollutants and dates)
+    bounds_info = get_sulaimani_bounds()
+    bounds = bounds_info['bounds']
+    min_lat, min_lon = bounds[0]
+    max_lat, max_lon = bounds[1]
+    
     # Pollutant configuration
     POLLUTANTS = {
         'NO2': {'units': 'µg/m³', 'guideline': 40.0},
@@ -192,88 +342,55 @@ def create_consistent_air_quality_dataset():
     # Generate 5 days of data (reduced from 10 for memory efficiency with 40x40 grid)
     dates = [(datetime.now() - timedelta(days=i)).strftime('%Y-%m-%d') for i in range(5)]
     
-    all_datasets = {}
+    # All pollutants on one (dates, grid points, pollutants) array; DataFrames
+    # are only built at the CSV boundary
+    pollutant_names = list(POLLUTANTS)
+    tensor = np.empty((len(dates), len(grid), len(pollutant_names)), dtype=np.float32)
     
-    for pollutant, config in POLLUTANTS.items():
+    for p_idx, (pollutant, config) in enumerate(POLLUTANTS.items()):
         print(f"\n🔬 Processing {pollutant} ({config['units']})...")
         
-        # Create mock original data (simulating scattered measurements)
-        original_data = []
-        for date in dates:
-            # Create 50 random measurements per day (simulating satellite overpasses)
-            n_orig = 50
-            bounds_info = get_sulaimani_bounds()
-            bounds = bounds_info['bounds']
-            min_lat, min_lon = bounds[0]
-            max_lat, max_lon = bounds[1]
-            
-            orig_lats = np.random.uniform(min_lat, max_lat, n_orig)
-            orig_lons = np.random.uniform(min_lon, max_lon, n_orig)
-            orig_values = np.random.uniform(5, 50, n_orig)  # Placeholder values
-            
-            for lat, lon, val in zip(orig_lats, orig_lons, orig_values):
-                original_data.append({
-                    'date': date,
-                    'lat': lat,
-                    'lon': lon,
-                    'value': val
-                })
-        
-        original_df = pd.DataFrame(original_data)
+        # Create mock original data (simulating scattered measurements):
+        # 50 random measurements per day (simulating satellite overpasses)
+        n_orig = 50
+        original_df = pd.DataFrame({
+            'date': np.repeat(dates, n_orig),
+            'lat': rng.uniform(min_lat, max_lat, len(dates) * n_orig),
+            'lon': rng.uniform(min_lon, max_lon, len(dates) * n_orig),
+            'value': rng.uniform(5, 50, len(dates) * n_orig)  # Placeholder values
+        })
         
         # Interpolate to consistent grid
-        interpolated_df = interpolate_pollutant_data(original_df, grid, pollutant)
-        interpolated_df['units'] = config['units']
+        print(f"   📊 Interpolating {pollutant} data onto regular grid...")
+        _, values = interpolate_pollutant_field(original_df, grid, pollutant, rng)
+        tensor[:, :, p_idx] = values
+        print(f"      ✅ Generated {values.size} interpolated measurements")
+        print(f"      📊 Value range: {values.min():.2f} - {values.max():.2f}")
         
         # Save individual pollutant file
-        filename = f"data/air_quality_{pollutant.lower()}_interpolated.csv"
-        interpolated_df.to_csv(filename, index=False)
-        print(f"      💾 Saved to {filename}")
-        
-        all_datasets[pollutant] = interpolated_df
+        if save_individual:
+            interpolated_df = pollutant_frame(dates, values, grid, pollutant)
+            interpolated_df['units'] = config['units']
+            filename = f"data/air_quality_{pollutant.lower()}_interpolated.csv"
+            interpolated_df.to_csv(filename, index=False, float_format=CSV_FLOAT_FORMAT)
+            print(f"      💾 Saved to {filename}")
         
         # Calculate statistics
-        avg_value = interpolated_df['value'].mean()
-        max_value = interpolated_df['value'].max()
-        above_guideline = (interpolated_df['value'] > config['guideline']).sum() / len(interpolated_df) * 100
+        avg_value = values.mean()
+        max_value = values.max()
+        above_guideline = (values > config['guideline']).mean() * 100
         
         print(f"      📈 Average: {avg_value:.2f} {config['units']}")
         print(f"      📊 Maximum: {max_value:.2f} {config['units']}")
         print(f"      ⚠️  Above guideline: {above_guideline:.1f}%")
     
-    # Create combined dataset for correlation analysis
-    combined_data = []
-    
-    for date in dates:
-        for _, grid_point in grid.iterrows():
-            grid_id = grid_point['grid_id']
-            lat = grid_point['lat']
-            lon = grid_point['lon']
-            
-            # Get values for all pollutants at this grid point and date
-            row_data = {
-                'date': date,
-                'lat': lat,
-                'lon': lon,
-                'grid_id': grid_id
-            }
-            
-            for pollutant in POLLUTANTS.keys():
-                pollutant_data = all_datasets[pollutant]
-                matching_row = pollutant_data[
-                    (pollutant_data['date'] == date) & 
-                    (pollutant_data['grid_id'] == grid_id)
-                ]
-                
-                if not matching_row.empty:
-                    row_data[f'{pollutant}_value'] = matching_row.iloc[0]['value']
-                else:
-                    row_data[f'{pollutant}_value'] = np.nan
-            
-            combined_data.append(row_data)
-    
-    combined_df = pd.DataFrame(combined_data)
-    combined_df.to_csv('data/air_quality_combined_grid.csv', index=False)
+    # Create combined dataset for correlation analysis straight from the array:
+    # rows are date-major, matching the per-pollutant files
+    combined_df = measurement_index(dates, grid)
+    flat = tensor.reshape(len(combined_df), len(pollutant_names))
+    for p_idx, pollutant in enumerate(pollutant_names):
+        combined_df[f'{pollutant}_value'] = flat[:, p_idx]
+    combined_df.to_csv('data/air_quality_combined_grid.csv', index=False, float_format=CSV_FLOAT_FORMAT)
     
     print(f"\n🎯 SUMMARY:")
     print(f"   ✅ Created consistent {len(grid)} point grid for all pollutants")
@@ -290,88 +407,35 @@ def create_composite_air_quality_index(combined_df):
     """
     print(f"\n🧮 Creating Composite Air Quality Index...")
     
-    # Normalize each pollutant to 0-100 scale based on WHO guidelines
-    WEIGHTS = {
-        'NO2': 0.25,    # High weight - direct health impact
-        'SO2': 0.20,    # High weight - respiratory effects  
-        'CO': 0.15,     # Medium weight - cardiovascular
-        'HCHO': 0.15,   # Medium weight - carcinogenic
-        'AER_AI': 0.15, # Medium weight - respiratory/visibility
-        'O3': 0.10      # Lower weight - beneficial in stratosphere
-    }
-    
-    # Guidelines for normalization
-    GUIDELINES = {
-        'NO2': 40.0,
-        'SO2': 20.0, 
-        'CO': 10.0,
-        'HCHO': 30.0,
-        'AER_AI': 2.0,
-        'O3': 300.0  # For O3, lower is worse (ozone depletion)
+    # AQI bands (upper bound inclusive) and their map colors
+    AQI_BINS = [-np.inf, 20, 40, 60, 80, 100, np.inf]
+    AQI_CATEGORIES = ['Excellent', 'Good', 'Moderate', 'Poor', 'Very Poor', 'Extremely Poor']
+    AQI_COLORS = {
+        'Excellent': 'green',
+        'Good': 'lightgreen',
+        'Moderate': 'yellow',
+        'Poor': 'orange',
+        'Very Poor': 'red',
+        'Extremely Poor': 'darkred'
     }
     
-    aqi_data = []
-    
-    for _, row in combined_df.iterrows():
-        aqi_score = 0
-        total_weight = 0
-        
-        for pollutant, weight in WEIGHTS.items():
-            value = row[f'{pollutant}_value']
-            
-            if not pd.isna(value):
-                guideline = GUIDELINES[pollutant]
-                
-                if pollutant == 'O3':
-                    # For ozone, lower values are worse (ozone depletion concern)
-                    normalized = max(0, 100 * (value / guideline))
-                    normalized = min(100, normalized)  # Cap at 100
-                    # Convert to risk scale (lower O3 = higher risk)
-                    risk_score = 100 - normalized
-                else:
-                    # For other pollutants, higher values are worse
-                    risk_score = min(100, 100 * (value / guideline))
-                
-                aqi_score += weight * risk_score
-                total_weight += weight
-        
-        if total_weight > 0:
-            final_aqi = aqi_score / total_weight
-        else:
-            final_aqi = np.nan
-            
-        # Categorize AQI
-        if final_aqi <= 20:
-            aqi_category = 'Excellent'
-            aqi_color = 'green'
-        elif final_aqi <= 40:
-            aqi_category = 'Good' 
-            aqi_color = 'lightgreen'
-        elif final_aqi <= 60:
-            aqi_category = 'Moderate'
-            aqi_color = 'yellow'
-        elif final_aqi <= 80:
-            aqi_category = 'Poor'
-            aqi_color = 'orange'
-        elif final_aqi <= 100:
-            aqi_category = 'Very Poor'
-            aqi_color = 'red'
-        else:
-            aqi_category = 'Extremely Poor'
-            aqi_color = 'darkred'
-        
-        aqi_data.append({
-            'date': row['date'],
-            'lat': row['lat'],
-            'lon': row['lon'],
-            'grid_id': row['grid_id'],
-            'aqi_score': final_aqi,
-            'aqi_category': aqi_category,
-            'aqi_color': aqi_color
-        })
-    
-    aqi_df = pd.DataFrame(aqi_data)
-    aqi_df.to_csv('data/composite_air_quality_index.csv', index=False)
+    pollutants = list(AQI_WEIGHTS)
+    values = combined_df[[f'{pollutant}_value' for pollutant in pollutants]].to_numpy(dtype=float)
+    final_aqi = composite_aqi_scores(values, pollutants)
+    
+    # Categorize AQI; points with no measurements fall in the top band as before
+    aqi_category = pd.cut(final_aqi, bins=AQI_BINS, labels=AQI_CATEGORIES).fillna('Extremely Poor')
+    
+    aqi_df = pd.DataFrame({
+        'date': combined_df['date'].to_numpy(),
+        'lat': combined_df['lat'].to_numpy(),
+        'lon': combined_df['lon'].to_numpy(),
+        'grid_id': combined_df['grid_id'].to_numpy(),
+        'aqi_score': final_aqi,
+        'aqi_category': aqi_category.astype(str),
+        'aqi_color': aqi_category.map(AQI_COLORS).astype(str)
+    })
+    aqi_df.to_csv('data/composite_air_quality_index.csv', index=False, float_format=CSV_FLOAT_FORMAT)
     
     print(f"   ✅ Created Composite AQI for {len(aqi_df)} measurements")
     
@@ -388,8 +452,13 @@ def create_composite_air_quality_index(combined_df):
     return aqi_df
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Create the consistent multi-pollutant air quality grid')
+    parser.add_argument('--save-individual', action='store_true',
+                       help='Also write one air_quality_<pollutant>_interpolated.csv per pollutant')
+    args = parser.parse_args()
+    
     # Create consistent dataset
-    combined_df, grid = create_consistent_air_quality_dataset()
+    combined_df, grid = create_consistent_air_quality_dataset(save_individual=args.save_individual)
     
     # Create composite AQI
     aqi_df = create_composite_air_quality_index(combined_df)
@@ -16,13 +16,14 @@ SULAIMANI_BOUNDS = {
     'max_lat': 35.72
 }
 
-def generate_sample_no2_data(num_days=10, points_per_day=150):
+def generate_sample_no2_data(num_days=10, points_per_day=150, rng=None):
     """
     Generate realistic sample NO₂ data for Sulaimani
     
     Args:
         num_days (int): Number of days to simulate
         points_per_day (int): Number of measurement points per day
+        rng (np.random.Generator): Random generator for the simulated values
     
     Returns:
         pandas.DataFrame: Sample NO₂ data
@@ -30,7 +31,14 @@ def generate_sample_no2_data(num_days=10, points_per_day=150):
     print("🛰️ Generating Sample NO₂ Data for Sulaimani...")
     print(f"Simulating {num_days} days with {points_per_day} measurements per day")
     
-    data = []
+    if rng is None:
+        rng = np.random.default_rng()
+    
+    daily_frames = []
+    
+    # City center and industrial area used to shape the concentration field
+    center_lat, center_lon = 35.5608, 45.4347
+    industrial_lat, industrial_lon = 35.54, 45.41
     
     # Create date range (last 10 days)
     end_date = datetime.now()
@@ -40,12 +48,12 @@ def generate_sample_no2_data(num_days=10, points_per_day=150):
         date_str = date.strftime('%Y-%m-%d')
         
         # Generate random points within Sulaimani bounds
-        lats = np.random.uniform(
+        lats = rng.uniform(
             SULAIMANI_BOUNDS['min_lat'], 
             SULAIMANI_BOUNDS['max_lat'], 
             points_per_day
         )
-        lons = np.random.uniform(
+        lons = rng.uniform(
             SULAIMANI_BOUNDS['min_lon'], 
             SULAIMANI_BOUNDS['max_lon'], 
             points_per_day
@@ -55,48 +63,38 @@ def generate_sample_no2_data(num_days=10, points_per_day=150):
         # Urban areas typically have higher NO₂ (40-80 µg/m³)
         # Rural areas have lower NO₂ (10-40 µg/m³)
         
-        base_values = []
-        for lat, lon in zip(lats, lons):
-            # Distance from city center (35.5608, 45.4347)
-            center_lat, center_lon = 35.5608, 45.4347
-            distance = np.sqrt((lat - center_lat)**2 + (lon - center_lon)**2)
-            
-            # Higher pollution near city center
-            if distance < 0.05:  # City center
-                base_no2 = np.random.normal(65, 15)  # High NO₂
-            elif distance < 0.10:  # Urban areas
-                base_no2 = np.random.normal(45, 12)  # Moderate NO₂
-            else:  # Suburban/rural
-                base_no2 = np.random.normal(25, 8)   # Lower NO₂
-            
-            # Add some seasonal variation (higher in winter)
-            seasonal_factor = 1.0 + 0.2 * np.sin(2 * np.pi * date.timetuple().tm_yday / 365)
-            
-            # Add daily variation (higher during rush hours - simulated)
-            daily_factor = np.random.uniform(0.8, 1.3)
-            
-            # Add some industrial hotspots
-            # Industrial area around (35.54, 45.41)
-            if abs(lat - 35.54) < 0.02 and abs(lon - 45.41) < 0.02:
-                base_no2 += np.random.uniform(20, 40)  # Industrial boost
-            
-            final_no2 = base_no2 * seasonal_factor * daily_factor
-            
-            # Ensure values are realistic (0-150 µg/m³)
-            final_no2 = max(5, min(150, final_no2))
-            
-            base_values.append(final_no2)
+        # Distance from city center; higher pollution near the center
+        distance = np.hypot(lats - center_lat, lons - center_lon)
+        base_no2 = np.where(
+            distance < 0.05, rng.normal(65, 15, points_per_day),      # City center: high NO₂
+            np.where(
+                distance < 0.10, rng.normal(45, 12, points_per_day),  # Urban areas: moderate NO₂
+                rng.normal(25, 8, points_per_day)                     # Suburban/rural: lower NO₂
+            )
+        )
+        
+        # Add some industrial hotspots around (35.54, 45.41)
+        industrial = (np.abs(lats - industrial_lat) < 0.02) & (np.abs(lons - industrial_lon) < 0.02)
+        base_no2 += industrial * rng.uniform(20, 40, points_per_day)
+        
+        # Add some seasonal variation (higher in winter)
+        seasonal_factor = 1.0 + 0.2 * np.sin(2 * np.pi * date.timetuple().tm_yday / 365)
+        
+        # Add daily variation (higher during rush hours - simulated)
+        daily_factor = rng.uniform(0.8, 1.3, points_per_day)
+        
+        # Ensure values are realistic (5-150 µg/m³)
+        final_no2 = np.clip(base_no2 * seasonal_factor * daily_factor, 5, 150)
         
         # Create records for this date
-        for lat, lon, no2_value in zip(lats, lons, base_values):
-            data.append({
-                'date': date_str,
-                'lat': round(lat, 4),
-                'lon': round(lon, 4),
-                'value': round(no2_value, 2)
-            })
+        daily_frames.append(pd.DataFrame({
+            'date': date_str,
+            'lat': np.round(lats, 4).astype(np.float32),
+            'lon': np.round(lons, 4).astype(np.float32),
+            'value': np.round(final_no2, 2).astype(np.float32)
+        }))
     
-    df = pd.DataFrame(data)
+    df = pd.concat(daily_frames, ignore_index=True)
     
     # Sort by date and location
     df = df.sort_values(['date', 'lat', 'lon']).reset_index(drop=True)
@@ -116,11 +114,13 @@ def create_sample_no2_files():
     os.makedirs('data', exist_ok=True)
     
     # Generate sample data
-    df = generate_sample_no2_data(num_days=10, points_per_day=150)
+    # Seeded so the demo files are reproducible between runs
+    rng = np.random.default_rng(42)
+    df = generate_sample_no2_data(num_days=10, points_per_day=150, rng=rng)
     
     # Save main data file
     output_file = 'data/air_quality_no2.csv'
-    df.to_csv(output_file, index=False)
+    df.to_csv(output_file, index=False, float_format='%.4f')
     
     print(f"\n✅ Saved {len(df)} NO₂ records to: {output_file}")
     
@@ -129,42 +129,47 @@ def create_sample_no2_files():
     print("SAMPLE NO₂ DATA STATISTICS")
     print("="*80)
     
-    print(f"\nTotal records: {len(df):,}")
-    print(f"Date range: {df['date'].min()} to {df['date'].max()}")
-    print(f"Unique dates: {df['date'].nunique()}")
-    
-    print(f"\nNO₂ Concentration (µg/m³):")
-    print(f"  Min:    {df['value'].min():.2f}")
-    print(f"  Max:    {df['value'].max():.2f}")
-    print(f"  Mean:   {df['value'].mean():.2f}")
-    print(f"  Median: {df['value'].median():.2f}")
+    # Rows are sorted by date, so the range comes from the first and last rows
+    n_dates = df['date'].nunique()
+    stats = df['value'].describe()
     
-    # WHO guideline comparison
-    who_guideline = 40  # µg/m³ annual average
-    above_who = (df['value'] > who_guideline).sum()
-    percent_above = (above_who / len(df)) * 100
-    
-    print(f"\nWHO Guideline Analysis (40 µg/m³):")
-    print(f"  Records above guideline: {above_who:,} ({percent_above:.1f}%)")
-    
-    # Create pollution categories
+    # Create pollution categories once; the guideline and category summaries
+    # are both read from it
     df['category'] = pd.cut(
         df['value'],
         bins=[0, 40, 80, 120, float('inf')],
         labels=['Good', 'Moderate', 'Unhealthy', 'Very Unhealthy']
     )
+    category_counts = df.groupby('category', observed=False).size()
+    
+    # WHO guideline comparison: every value above 40 µg/m³ falls outside 'Good'
+    who_guideline = 40  # µg/m³ annual average
+    above_who = len(df) - category_counts['Good']
+    percent_above = (above_who / len(df)) * 100
     
-    category_counts = df['category'].value_counts()
-    print(f"\nPollution Categories:")
+    lines = [
+        f"\nTotal records: {len(df):,}",
+        f"Date range: {df['date'].iat[0]} to {df['date'].iat[-1]}",
+        f"Unique dates: {n_dates}",
+        f"\nNO₂ Concentration (µg/m³):",
+        f"  Min:    {stats['min']:.2f}",
+        f"  Max:    {stats['max']:.2f}",
+        f"  Mean:   {stats['mean']:.2f}",
+        f"  Median: {stats['50%']:.2f}",
+        f"\nWHO Guideline Analysis ({who_guideline} µg/m³):",
+        f"  Records above guideline: {above_who:,} ({percent_above:.1f}%)",
+        f"\nPollution Categories:"
+    ]
     for category, count in category_counts.items():
         percent = (count / len(df)) * 100
-        print(f"  {category}: {count:,} ({percent:.1f}%)")
+        lines.append(f"  {category}: {count:,} ({percent:.1f}%)")
+    print("\n".join(lines))
     
     # Save hotspots file (high pollution areas)
     hotspots = df[df['value'] > 80].copy()
     if not hotspots.empty:
         hotspots_file = 'data/pollution_hotspots.csv'
-        hotspots.to_csv(hotspots_file, index=False)
+        hotspots.to_csv(hotspots_file, index=False, float_format='%.4f')
         print(f"\n✅ Saved {len(hotspots)} pollution hotspots to: {hotspots_file}")
     
     # Preview data
@@ -184,7 +189,7 @@ def create_sample_no2_files():
     print(f"  - Higher pollution in city center ({df[df['value'] > 60]['value'].mean():.1f} µg/m³)")
     print(f"  - Lower pollution in suburbs ({df[df['value'] < 30]['value'].mean():.1f} µg/m³)")
     print(f"  - Industrial hotspots with elevated NO₂")
-    print(f"  - Temporal variation over {df['date'].nunique()} days")
+    print(f"  - Temporal variation over {n_dates} days")
     
     print(f"\n🔄 To get real Sentinel-5P data later:")
     print(f"  1. Wait for S5P-PAL API to be available")
@@ -1,9 +1,20 @@
+import os
 import pandas as pd
 import numpy as np
 from shapely.geometry import Polygon, Point
 
 # Load air quality data to check actual coverage
-df = pd.read_csv('data_solution/enhanced_air_quality_detailed.csv')
+AIR_QUALITY_CSV = 'data_solution/enhanced_air_quality_detailed.csv'
+AIR_QUALITY_PARQUET = 'data_solution/enhanced_air_quality_detailed.parquet'
+# Coordinates stay float64 so the printed six-decimal values match the source
+COORD_DTYPES = {'lat': 'float64', 'lon': 'float64'}
+
+# Only coordinates are inspected; prefer the Parquet copy while it is current
+if os.path.exists(AIR_QUALITY_PARQUET) and os.path.getmtime(AIR_QUALITY_PARQUET) >= os.path.getmtime(AIR_QUALITY_CSV):
+    df = pd.read_parquet(AIR_QUALITY_PARQUET, columns=['lat', 'lon']).astype(COORD_DTYPES)
+else:
+    df = pd.read_csv(AIR_QUALITY_CSV, usecols=['lat', 'lon'], dtype=COORD_DTYPES, engine='pyarrow')
+
 print(f"Air quality data coverage:")
 print(f"  Latitude range: {df['lat'].min():.6f} to {df['lat'].max():.6f}")
 print(f"  Longitude range: {df['lon'].min():.6f} to {df['lon'].max():.6f}")
@@ -15,15 +26,20 @@ sulaimani_lat, sulaimani_lon = 35.5647, 45.4164
 print(f"Sulaimani center: {sulaimani_lat}, {sulaimani_lon}")
 print()
 
-# Find closest data points to Sulaimani center
-distances = np.sqrt((df['lat'] - sulaimani_lat)**2 + (df['lon'] - sulaimani_lon)**2)
-closest_indices = distances.nsmallest(10).index
+# Find closest data points to Sulaimani center: partial selection on
+# squared distance (same order, no sqrt) instead of sorting every point
+lats = df['lat'].to_numpy()
+lons = df['lon'].to_numpy()
+dist_sq = (lats - sulaimani_lat)**2 + (lons - sulaimani_lon)**2
+# Ties at the cut-off go to the lowest index, as with nsmallest(keep='first')
+k = min(10, len(dist_sq))
+cutoff = np.partition(dist_sq, k - 1)[k - 1]
+candidates = np.flatnonzero(dist_sq <= cutoff)
+closest_indices = candidates[np.argsort(dist_sq[candidates], kind='stable')[:k]]
 
 print("10 closest data points to Sulaimani center:")
 for idx in closest_indices:
-    row = df.iloc[idx]
-    dist = distances[idx]
-    print(f"  Point {idx}: ({row['lat']:.6f}, {row['lon']:.6f}) - Distance: {dist:.6f}")
+    print(f"  Point {idx}: ({lats[idx]:.6f}, {lons[idx]:.6f}) - Distance: {np.sqrt(dist_sq[idx]):.6f}")
 
 # Test if data exists around Sulaimani center
 buffer = 0.1  # Large buffer to capture nearby points
@@ -38,5 +54,5 @@ print(f"\nPoints within {buffer} degrees of Sulaimani center: {len(nearby_points
 
 if len(nearby_points) > 0:
     print("Sample nearby points:")
-    for _, row in nearby_points.head(5).iterrows():
-        print(f"  ({row['lat']:.6f}, {row['lon']:.6f})")
\ No newline at end of file
+    for row in nearby_points.head(5).itertuples(index=False):
+        print(f"  ({row.lat:.6f}, {row.lon:.6f})")
\ No newline at end of file
@@ -1,11 +1,26 @@
+import os
 import pandas as pd
 import numpy as np
-from shapely.geometry import Polygon, Point
+import shapely
+from shapely.geometry import Polygon
 
 # Load data
-df = pd.read_csv('data_solution/enhanced_air_quality_detailed.csv')
+AIR_QUALITY_CSV = 'data_solution/enhanced_air_quality_detailed.csv'
+AIR_QUALITY_PARQUET = 'data_solution/enhanced_air_quality_detailed.parquet'
+# Coordinates stay float64 so the printed six-decimal values match the source
+COORD_DTYPES = {'lat': 'float64', 'lon': 'float64'}
+
+# Only coordinates are inspected; prefer the Parquet copy while it is current
+if os.path.exists(AIR_QUALITY_PARQUET) and os.path.getmtime(AIR_QUALITY_PARQUET) >= os.path.getmtime(AIR_QUALITY_CSV):
+    df = pd.read_parquet(AIR_QUALITY_PARQUET, columns=['lat', 'lon']).astype(COORD_DTYPES)
+else:
+    df = pd.read_csv(AIR_QUALITY_CSV, usecols=['lat', 'lon'], dtype=COORD_DTYPES, engine='pyarrow')
 sulaimani_lat, sulaimani_lon = 35.5647, 45.4164
 
+# Coordinate arrays for vectorized point-in-polygon tests
+lons = df['lon'].to_numpy()
+lats = df['lat'].to_numpy()
+
 # Simulate st_folium drawing around Sulaimani
 # When user draws on map, st_folium returns coordinates in [lat, lon] format
 buffer_size = 0.02  # Larger area
@@ -30,11 +45,7 @@ incorrect_buffered = incorrect_polygon.buffer(0.001)
 print(f"\nIncorrect polygon bounds (lon, lat): {incorrect_polygon.bounds}")
 
 # Count points with incorrect processing
-incorrect_count = 0
-for _, row in df.head(1000).iterrows():
-    point = Point(row['lon'], row['lat'])
-    if incorrect_buffered.contains(point):
-        incorrect_count += 1
+incorrect_count = int(shapely.contains_xy(incorrect_buffered, lons[:1000], lats[:1000]).sum())
 
 print(f"Points found with INCORRECT processing (first 1000): {incorrect_count}")
 
@@ -50,14 +61,10 @@ correct_buffered = correct_polygon.buffer(0.001)
 print(f"Polygon bounds (lon, lat): {correct_polygon.bounds}")
 
 # The real issue might be the buffer size or coordinate precision
-correct_count = 0
-sample_points = []
-for _, row in df.head(10000).iterrows():  # Test more points
-    point = Point(row['lon'], row['lat'])
-    if correct_buffered.contains(point):
-        correct_count += 1
-        if len(sample_points) < 5:
-            sample_points.append((row['lat'], row['lon']))
+inside = shapely.contains_xy(correct_buffered, lons[:10000], lats[:10000])  # Test more points
+correct_count = int(inside.sum())
+sample_idx = np.flatnonzero(inside)[:5]
+sample_points = list(zip(lats[sample_idx], lons[sample_idx]))
 
 print(f"Points found with correct processing (first 10000): {correct_count}")
 if sample_points:
@@ -67,10 +74,6 @@ if sample_points:
 
 # Test with larger buffer
 larger_buffered = correct_polygon.buffer(0.005)  # 5x larger buffer
-larger_count = 0
-for _, row in df.head(1000).iterrows():
-    point = Point(row['lon'], row['lat'])
-    if larger_buffered.contains(point):
-        larger_count += 1
+larger_count = int(shapely.contains_xy(larger_buffered, lons[:1000], lats[:1000]).sum())
 
 print(f"Points with larger buffer (first 1000): {larger_count}")
\ No newline at end of file
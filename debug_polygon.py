@@ -1,8 +1,11 @@
 import pandas as pd
 import numpy as np
+import shapely
 from shapely.geometry import Polygon, Point
+from shapely.strtree import STRtree
 
-df = pd.read_csv('data_solution/enhanced_topography_detailed.csv')
+df = pd.read_csv('data_solution/enhanced_topography_detailed.csv', usecols=['lat', 'lon'],
+                 dtype={'lat': 'float64', 'lon': 'float64'}, engine='pyarrow')
 sulaimani_lat, sulaimani_lon = 35.5647, 45.4164
 buffer_size = 0.01
 
@@ -25,22 +28,24 @@ for coord in coords[:4]:
 shapely_coords = [(coord[1], coord[0]) for coord in coords]
 polygon = Polygon(shapely_coords)
 buffered = polygon.buffer(0.001)
+# Prepare once so the tree query and the point test below reuse GEOS's edge index
+shapely.prepare(buffered)
+xmin, ymin, xmax, ymax = buffered.bounds
 
 print(f'Polygon bounds (lon, lat): {polygon.bounds}')
-print(f'Buffered bounds (lon, lat): {buffered.bounds}')
+print(f'Buffered bounds (lon, lat): {(xmin, ymin, xmax, ymax)}')
 
-# Test actual polygon intersection
-points_in_polygon = 0
-for i, row in df.iterrows():
-    if i > 1000: break  # Test first 1000 points
-    point = Point(row['lon'], row['lat'])
-    if buffered.contains(point):
-        points_in_polygon += 1
+lons = np.ascontiguousarray(df['lon'].to_numpy(dtype=np.float64))
+lats = np.ascontiguousarray(df['lat'].to_numpy(dtype=np.float64))
+
+# Test actual polygon intersection (rows 0-1000, as the original loop did)
+points_in_polygon = int(np.count_nonzero(shapely.contains_xy(buffered, lons[:1001], lats[:1001])))
 
 print(f'Points in polygon (first 1000): {points_in_polygon}')
 
-# Test specific point near center
-closest_row = df.iloc[np.sqrt((df['lat'] - sulaimani_lat)**2 + (df['lon'] - sulaimani_lon)**2).idxmin()]
+# Test specific point near center; the tree only visits nodes near the query point
+tree = STRtree(shapely.points(lons, lats))
+closest_row = df.iloc[tree.nearest(Point(sulaimani_lon, sulaimani_lat))]
 test_point = Point(closest_row['lon'], closest_row['lat'])
 print(f'Closest point: {closest_row["lat"]:.6f}, {closest_row["lon"]:.6f}')
-print(f'Point in buffered polygon: {buffered.contains(test_point)}')
\ No newline at end of file
+print(f'Point in buffered polygon: {buffered.contains(test_point)}')
@@ -1,11 +1,18 @@
 import pandas as pd
 import numpy as np
+import shapely
 from shapely.geometry import Polygon, Point
+from utils.point_in_polygon import contains_xy as ray_contains_xy
 
 # Load data
-df = pd.read_csv('data_solution/enhanced_air_quality_detailed.csv')
+df = pd.read_csv('data_solution/enhanced_air_quality_detailed.csv', usecols=['date', 'lat', 'lon'],
+                 dtype={'lat': 'float64', 'lon': 'float64'}, engine='pyarrow')
 latest = df[df['date'] == df['date'].max()]
 
+# Coordinates of the first 1000 latest points, tested in single GEOS calls
+lons = np.ascontiguousarray(latest['lon'].to_numpy(dtype=np.float64)[:1000])
+lats = np.ascontiguousarray(latest['lat'].to_numpy(dtype=np.float64)[:1000])
+
 # Test coordinates around Sulaimani
 sulaimani_lat, sulaimani_lon = 35.5647, 45.4164
 buffer_size = 0.02
@@ -22,28 +29,26 @@ coords_latlon = [
 # Convert to shapely format [lon, lat]
 shapely_coords = [(coord[1], coord[0]) for coord in coords_latlon]
 polygon = Polygon(shapely_coords)
+# Prepared geometries carry an edge index that every contains query reuses
+shapely.prepare(polygon)
 
 print(f"Polygon bounds: {polygon.bounds}")
 print(f"Polygon area: {polygon.area:.8f}")
 
 # Simple bounding box test first
-bbox_count = 0
-for _, row in latest.head(1000).iterrows():
-    if (polygon.bounds[0] <= row['lon'] <= polygon.bounds[2] and 
-        polygon.bounds[1] <= row['lat'] <= polygon.bounds[3]):
-        bbox_count += 1
+xmin, ymin, xmax, ymax = polygon.bounds
+in_bbox = (lons >= xmin) & (lons <= xmax) & (lats >= ymin) & (lats <= ymax)
+bbox_count = int(in_bbox.sum())
 
 print(f"Points in bounding box (first 1000): {bbox_count}")
 
 # Point-in-polygon test without buffer
-pip_count = 0
-pip_samples = []
-for _, row in latest.head(1000).iterrows():
-    point = Point(row['lon'], row['lat'])
-    if polygon.contains(point):
-        pip_count += 1
-        if len(pip_samples) < 3:
-            pip_samples.append((row['lat'], row['lon']))
+# Only bounding-box candidates can be inside, so GEOS tests just those
+inside = np.zeros(len(lons), dtype=bool)
+inside[in_bbox] = shapely.contains_xy(polygon, lons[in_bbox], lats[in_bbox])
+pip_count = int(inside.sum())
+pip_idx = np.flatnonzero(inside)[:3]
+pip_samples = list(zip(lats[pip_idx], lons[pip_idx]))
 
 print(f"Points in polygon (first 1000): {pip_count}")
 if pip_samples:
@@ -51,13 +56,14 @@ if pip_samples:
     for lat, lon in pip_samples:
         print(f"  ({lat:.6f}, {lon:.6f})")
 
+# Cross-check GEOS against the independent ray-casting kernel
+ray_count = int(ray_contains_xy(polygon, lons, lats).sum())
+print(f"Ray-casting agrees with GEOS: {ray_count == pip_count} ({ray_count} points)")
+
 # Test with buffer
 buffered = polygon.buffer(0.001)
-buffered_count = 0
-for _, row in latest.head(1000).iterrows():
-    point = Point(row['lon'], row['lat'])  
-    if buffered.contains(point):
-        buffered_count += 1
+shapely.prepare(buffered)
+buffered_count = int(shapely.contains_xy(buffered, lons, lats).sum())
 
 print(f"Points in buffered polygon (first 1000): {buffered_count}")
 
@@ -69,10 +75,7 @@ print(f"Sulaimani center in buffered: {buffered.contains(test_point)}")
 
 # Test with much larger buffer
 large_buffered = polygon.buffer(0.01)  # 10x larger
-large_count = 0
-for _, row in latest.head(1000).iterrows():
-    point = Point(row['lon'], row['lat'])
-    if large_buffered.contains(point):
-        large_count += 1
+shapely.prepare(large_buffered)
+large_count = int(shapely.contains_xy(large_buffered, lons, lats).sum())
 
 print(f"Points in large buffered polygon (first 1000): {large_count}")
\ No newline at end of file
@@ -23,9 +23,21 @@ import cdsapi
 import pandas as pd
 import numpy as np
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import xarray as xr
 import json
+from utils.table_io import save_table
+
+# orjson encodes GeoJSON several times faster; fall back to the stdlib
+try:
+    import orjson
+    
+    def json_bytes(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def json_bytes(data):
+        return json.dumps(data, indent=2).encode()
 
 # Sulaimani coordinates and bounds
 SULAIMANI_BOUNDS = {
@@ -37,6 +49,22 @@ SULAIMANI_BOUNDS = {
 
 SULAIMANI_CENTER = {'lat': 35.56, 'lon': 45.43}
 
+# Output precision per measurement column (stored as float32)
+TEMPERATURE_DECIMALS = {
+    'air_temperature_2m': 2,
+    'land_surface_temperature': 2,
+    'heat_island_intensity': 2
+}
+VEGETATION_DECIMALS = {
+    'lai_high_vegetation': 3,
+    'lai_low_vegetation': 3,
+    'total_lai': 3,
+    'estimated_ndvi': 3
+}
+
+# Time steps decoded per block when flattening NetCDF cubes
+NETCDF_TIME_BLOCK = 24
+
 def setup_cds_client():
     """Initialize CDS API client"""
     try:
@@ -154,60 +182,73 @@ def download_satellite_land_cover(client, year='2020'):
         print(f"❌ Failed to download land cover data: {e}")
         return None
 
+def round_columns(df, decimals):
+    """Cast measurement columns to float32 and round them in one pass"""
+    decimals = {col: places for col, places in decimals.items() if col in df.columns}
+    return df.astype({col: np.float32 for col in decimals}).round(decimals)
+
+def daily_means(df, columns, decimals):
+    """Per-date column means from one factorize and a bincount per column"""
+    codes, dates = pd.factorize(df['date'], sort=True)
+    counts = np.bincount(codes, minlength=len(dates))
+    means = {
+        col: np.bincount(codes, weights=df[col].to_numpy(dtype=np.float64), minlength=len(dates)) / counts
+        for col in columns
+    }
+    return pd.DataFrame(means, index=pd.Index(dates, name='date')).round(decimals)
+
+def time_blocks(ds, size=NETCDF_TIME_BLOCK):
+    """Yield consecutive time slices of a lazily opened dataset"""
+    for start in range(0, ds.sizes['time'], size):
+        yield ds.isel(time=slice(start, start + size))
+
+def temperature_frame(ds):
+    """Flatten a temperature dataset into one row per valid (time, lat, lon) cell"""
+    # Convert temperatures from Kelvin to Celsius on the whole cube at once
+    dims = ('time', 'latitude', 'longitude')
+    t2m = (ds['t2m'].transpose(*dims).values.astype(np.float32) - np.float32(273.15)).ravel()
+    skt = (ds['skt'].transpose(*dims).values.astype(np.float32) - np.float32(273.15)).ravel()
+    
+    # Create grid points, flattened in (time, lat, lon) order
+    lats = ds.latitude.values
+    lons = ds.longitude.values
+    times = ds.time.values
+    n_cells = len(lats) * len(lons)
+    
+    # Skip cells where either temperature is NaN
+    valid = ~(np.isnan(t2m) | np.isnan(skt))
+    
+    # Format each time step once, then repeat the labels across its cells
+    stamps = pd.to_datetime(times)
+    
+    df = pd.DataFrame({
+        'datetime': np.repeat(stamps.strftime('%Y-%m-%d %H:%M').to_numpy(), n_cells)[valid],
+        'date': np.repeat(stamps.strftime('%Y-%m-%d').to_numpy(), n_cells)[valid],
+        'time': np.repeat(stamps.strftime('%H:%M').to_numpy(), n_cells)[valid],
+        'lat': np.tile(np.repeat(lats, len(lons)), len(times))[valid].astype(np.float32),
+        'lon': np.tile(lons, len(lats) * len(times))[valid].astype(np.float32),
+        'air_temperature_2m': t2m[valid],
+        'land_surface_temperature': skt[valid],
+        'heat_island_intensity': skt[valid] - t2m[valid]
+    })
+    return round_columns(df, TEMPERATURE_DECIMALS)
+
 def process_temperature_data(netcdf_file):
     """Process temperature NetCDF into CSV format for visualization"""
     print("🔄 Processing temperature data...")
     
     try:
-        # Read NetCDF data
-        ds = xr.open_dataset(netcdf_file)
-        
-        # Convert temperatures from Kelvin to Celsius
-        t2m = ds['t2m'] - 273.15  # 2m temperature
-        skt = ds['skt'] - 273.15  # Skin temperature (land surface temp)
-        
-        # Create grid points
-        lats = ds.latitude.values
-        lons = ds.longitude.values
-        times = ds.time.values
-        
-        temperature_data = []
-        
-        for i, time in enumerate(times):
-            date_str = pd.to_datetime(time).strftime('%Y-%m-%d %H:%M')
-            
-            for j, lat in enumerate(lats):
-                for k, lon in enumerate(lons):
-                    # Get temperature values
-                    t2m_val = float(t2m.isel(time=i, latitude=j, longitude=k).values)
-                    skt_val = float(skt.isel(time=i, latitude=j, longitude=k).values)
-                    
-                    # Skip if NaN
-                    if np.isnan(t2m_val) or np.isnan(skt_val):
-                        continue
-                        
-                    temperature_data.append({
-                        'datetime': date_str,
-                        'date': date_str.split(' ')[0],
-                        'time': date_str.split(' ')[1],
-                        'lat': float(lat),
-                        'lon': float(lon),
-                        'air_temperature_2m': round(t2m_val, 2),
-                        'land_surface_temperature': round(skt_val, 2),
-                        'heat_island_intensity': round(skt_val - t2m_val, 2)
-                    })
+        # Read NetCDF data lazily; only one block of time steps is decoded at a time
+        with xr.open_dataset(netcdf_file) as ds:
+            blocks = time_blocks(ds[['t2m', 'skt']])
+            df = pd.concat([temperature_frame(block) for block in blocks], ignore_index=True)
         
         # Save to CSV
-        df = pd.DataFrame(temperature_data)
-        df.to_csv('data/temperature_data.csv', index=False)
+        save_table(df, 'data/temperature_data.csv')
         print(f"✅ Processed {len(df)} temperature records")
         
         # Create summary statistics
-        daily_avg = df.groupby('date').agg({
-            'air_temperature_2m': 'mean',
-            'land_surface_temperature': 'mean',
-            'heat_island_intensity': 'mean'
-        }).round(2)
+        daily_avg = daily_means(df, list(TEMPERATURE_DECIMALS), 2)
         
         daily_avg.to_csv('data/daily_temperature_summary.csv')
         print(f"✅ Created daily temperature summary ({len(daily_avg)} days)")
@@ -218,51 +259,48 @@ def process_temperature_data(netcdf_file):
         print(f"❌ Error processing temperature data: {e}")
         return None
 
+def vegetation_frame(ds):
+    """Flatten a leaf area index dataset into one row per valid (time, lat, lon) cell"""
+    # Leaf Area Index data, flattened in (time, lat, lon) order
+    dims = ('time', 'latitude', 'longitude')
+    lai_hv = ds['lai_hv'].transpose(*dims).values.astype(np.float32).ravel()  # High vegetation
+    lai_lv = ds['lai_lv'].transpose(*dims).values.astype(np.float32).ravel()  # Low vegetation
+    
+    lats = ds.latitude.values
+    lons = ds.longitude.values
+    times = ds.time.values
+    n_cells = len(lats) * len(lons)
+    
+    valid = ~(np.isnan(lai_hv) | np.isnan(lai_lv))
+    lai_hv = lai_hv[valid]
+    lai_lv = lai_lv[valid]
+    
+    # Calculate total LAI and estimated NDVI
+    total_lai = lai_hv + lai_lv
+    estimated_ndvi = np.minimum(0.95, total_lai / 6.0)  # Rough LAI to NDVI conversion
+    
+    vegetation_data = {
+        'date': np.repeat(pd.to_datetime(times).strftime('%Y-%m-%d').to_numpy(), n_cells)[valid],
+        'lat': np.tile(np.repeat(lats, len(lons)), len(times))[valid].astype(np.float32),
+        'lon': np.tile(lons, len(lats) * len(times))[valid].astype(np.float32),
+        'lai_high_vegetation': lai_hv,
+        'lai_low_vegetation': lai_lv,
+        'total_lai': total_lai,
+        'estimated_ndvi': estimated_ndvi,
+        'vegetation_category': categorize_vegetation(estimated_ndvi)
+    }
+    return round_columns(pd.DataFrame(vegetation_data), VEGETATION_DECIMALS)
+
 def process_vegetation_data(netcdf_file):
     """Process vegetation NetCDF into CSV format"""
     print("🔄 Processing vegetation data...")
     
     try:
-        ds = xr.open_dataset(netcdf_file)
+        with xr.open_dataset(netcdf_file) as ds:
+            blocks = time_blocks(ds[['lai_hv', 'lai_lv']])
+            df = pd.concat([vegetation_frame(block) for block in blocks], ignore_index=True)
         
-        # Leaf Area Index data
-        lai_hv = ds['lai_hv']  # High vegetation
-        lai_lv = ds['lai_lv']  # Low vegetation
-        
-        lats = ds.latitude.values
-        lons = ds.longitude.values
-        times = ds.time.values
-        
-        vegetation_data = []
-        
-        for i, time in enumerate(times):
-            date_str = pd.to_datetime(time).strftime('%Y-%m-%d')
-            
-            for j, lat in enumerate(lats):
-                for k, lon in enumerate(lons):
-                    lai_hv_val = float(lai_hv.isel(time=i, latitude=j, longitude=k).values)
-                    lai_lv_val = float(lai_lv.isel(time=i, latitude=j, longitude=k).values)
-                    
-                    if np.isnan(lai_hv_val) or np.isnan(lai_lv_val):
-                        continue
-                    
-                    # Calculate total LAI and estimated NDVI
-                    total_lai = lai_hv_val + lai_lv_val
-                    estimated_ndvi = min(0.95, total_lai / 6.0)  # Rough LAI to NDVI conversion
-                    
-                    vegetation_data.append({
-                        'date': date_str,
-                        'lat': float(lat),
-                        'lon': float(lon),
-                        'lai_high_vegetation': round(lai_hv_val, 3),
-                        'lai_low_vegetation': round(lai_lv_val, 3),
-                        'total_lai': round(total_lai, 3),
-                        'estimated_ndvi': round(estimated_ndvi, 3),
-                        'vegetation_category': categorize_vegetation(estimated_ndvi)
-                    })
-        
-        df = pd.DataFrame(vegetation_data)
-        df.to_csv('data/vegetation_data.csv', index=False)
+        save_table(df, 'data/vegetation_data.csv')
         print(f"✅ Processed {len(df)} vegetation records")
         
         return df
@@ -272,92 +310,86 @@ def process_vegetation_data(netcdf_file):
         return None
 
 def categorize_vegetation(ndvi):
-    """Categorize vegetation based on NDVI values"""
-    if ndvi < 0.1:
-        return "No Vegetation"
-    elif ndvi < 0.3:
-        return "Sparse Vegetation"
-    elif ndvi < 0.6:
-        return "Moderate Vegetation"
-    else:
-        return "Dense Vegetation"
+    """Categorize vegetation based on an array of NDVI values"""
+    # Left-closed bins: 0.1 is already Sparse, 0.3 Moderate and 0.6 Dense
+    return pd.cut(
+        ndvi,
+        bins=[-np.inf, 0.1, 0.3, 0.6, np.inf],
+        labels=['No Vegetation', 'Sparse Vegetation', 'Moderate Vegetation', 'Dense Vegetation'],
+        right=False
+    )
 
-def create_sample_data():
-    """Create sample data if API downloads fail"""
+def create_sample_data(seed=42):
+    """Create sample data if API downloads fail, reproducibly for a given seed"""
     print("🔄 Creating sample heat and vegetation data...")
     
+    rng = np.random.default_rng(seed)
+    
     # Create sample temperature grid
-    lats = np.linspace(35.40, 35.72, 40)
-    lons = np.linspace(45.25, 45.62, 40)
-    dates = pd.date_range('2024-06-01', '2024-08-31', freq='D')
+    lats = np.linspace(35.40, 35.72, 40, dtype=np.float32)
+    lons = np.linspace(45.25, 45.62, 40, dtype=np.float32)
+    dates = pd.date_range('2024-06-01', '2024-08-31', freq='D')[:30]  # Sample 30 days
     
-    temperature_data = []
-    vegetation_data = []
+    # Broadcast to a (date, lat, lon) grid so every field is one array expression
+    D, LA, LO = np.meshgrid(np.arange(len(dates)), lats, lons, indexing='ij')
     
-    for date in dates[:30]:  # Sample 30 days
-        date_str = date.strftime('%Y-%m-%d')
-        
-        for lat in lats:
-            for lon in lons:
-                # Distance from city center (for heat island effect)
-                center_dist = np.sqrt((lat - 35.56)**2 + (lon - 45.43)**2)
-                
-                # Base temperature varies by season and distance from center
-                base_temp = 35 + 5 * np.sin((date.dayofyear - 150) * 2 * np.pi / 365)
-                
-                # Urban heat island effect (hotter near center)
-                urban_effect = max(0, 8 - center_dist * 20)  # Up to 8°C warmer in center
-                
-                # Add some randomness
-                noise = np.random.normal(0, 2)
-                
-                air_temp = base_temp + urban_effect * 0.5 + noise
-                surface_temp = base_temp + urban_effect + noise + 5  # Surface hotter than air
-                
-                # Vegetation decreases with urban density
-                vegetation_factor = max(0.1, 1 - center_dist * 2)
-                base_ndvi = 0.7 * vegetation_factor
-                ndvi = max(0.05, base_ndvi + np.random.normal(0, 0.1))
-                
-                temperature_data.append({
-                    'date': date_str,
-                    'lat': round(lat, 4),
-                    'lon': round(lon, 4),
-                    'air_temperature_2m': round(air_temp, 2),
-                    'land_surface_temperature': round(surface_temp, 2),
-                    'heat_island_intensity': round(surface_temp - air_temp, 2)
-                })
-                
-                vegetation_data.append({
-                    'date': date_str,
-                    'lat': round(lat, 4),
-                    'lon': round(lon, 4),
-                    'estimated_ndvi': round(ndvi, 3),
-                    'vegetation_category': categorize_vegetation(ndvi)
-                })
+    # Distance from city center (for heat island effect)
+    center_dist = np.hypot(LA - SULAIMANI_CENTER['lat'], LO - SULAIMANI_CENTER['lon'])
+    
+    # Base temperature varies by season and distance from center
+    base_temp = 35 + 5 * np.sin((dates.dayofyear.to_numpy()[D] - 150) * 2 * np.pi / 365)
+    
+    # Urban heat island effect (hotter near center)
+    urban_effect = np.maximum(0, 8 - center_dist * 20)  # Up to 8°C warmer in center
+    
+    # Add some randomness
+    noise = rng.normal(0, 2, size=D.shape)
+    
+    air_temp = base_temp + urban_effect * 0.5 + noise
+    surface_temp = base_temp + urban_effect + noise + 5  # Surface hotter than air
+    
+    # Vegetation decreases with urban density
+    vegetation_factor = np.maximum(0.1, 1 - center_dist * 2)
+    base_ndvi = 0.7 * vegetation_factor
+    ndvi = np.maximum(0.05, base_ndvi + rng.normal(0, 0.1, size=D.shape)).ravel()
+    
+    date_col = dates.strftime('%Y-%m-%d').to_numpy()[D.ravel()]
+    lat_col = np.round(LA.ravel(), 4)
+    lon_col = np.round(LO.ravel(), 4)
+    
+    temp_df = pd.DataFrame({
+        'date': date_col,
+        'lat': lat_col,
+        'lon': lon_col,
+        'air_temperature_2m': air_temp.ravel(),
+        'land_surface_temperature': surface_temp.ravel(),
+        'heat_island_intensity': (surface_temp - air_temp).ravel()
+    })
+    temp_df = round_columns(temp_df, TEMPERATURE_DECIMALS)
+    
+    veg_df = pd.DataFrame({
+        'date': date_col,
+        'lat': lat_col,
+        'lon': lon_col,
+        'estimated_ndvi': ndvi,
+        'vegetation_category': categorize_vegetation(ndvi)
+    })
+    veg_df = round_columns(veg_df, VEGETATION_DECIMALS)
     
     # Save sample data
-    pd.DataFrame(temperature_data).to_csv('data/temperature_data.csv', index=False)
-    pd.DataFrame(vegetation_data).to_csv('data/vegetation_data.csv', index=False)
+    save_table(temp_df, 'data/temperature_data.csv')
+    save_table(veg_df, 'data/vegetation_data.csv')
     
     # Create daily summaries
-    temp_df = pd.DataFrame(temperature_data)
-    daily_temp = temp_df.groupby('date').agg({
-        'air_temperature_2m': 'mean',
-        'land_surface_temperature': 'mean', 
-        'heat_island_intensity': 'mean'
-    }).round(2)
+    daily_temp = daily_means(temp_df, list(TEMPERATURE_DECIMALS), 2)
     daily_temp.to_csv('data/daily_temperature_summary.csv')
     
-    veg_df = pd.DataFrame(vegetation_data)
-    daily_veg = veg_df.groupby('date').agg({
-        'estimated_ndvi': 'mean'
-    }).round(3)
+    daily_veg = daily_means(veg_df, ['estimated_ndvi'], 3)
     daily_veg.to_csv('data/daily_vegetation_summary.csv')
     
     print("✅ Created sample temperature and vegetation data")
-    print(f"📊 Temperature records: {len(temperature_data)}")
-    print(f"🌱 Vegetation records: {len(vegetation_data)}")
+    print(f"📊 Temperature records: {len(temp_df)}")
+    print(f"🌱 Vegetation records: {len(veg_df)}")
 
 def create_green_spaces_geojson():
     """Create GeoJSON for existing and proposed green spaces"""
@@ -454,11 +486,11 @@ def create_green_spaces_geojson():
     }
     
     # Save GeoJSON files
-    with open('data/existing_parks.geojson', 'w') as f:
-        json.dump(existing_parks, f, indent=2)
+    with open('data/existing_parks.geojson', 'wb') as f:
+        f.write(json_bytes(existing_parks))
         
-    with open('data/proposed_parks.geojson', 'w') as f:
-        json.dump(proposed_parks, f, indent=2)
+    with open('data/proposed_parks.geojson', 'wb') as f:
+        f.write(json_bytes(proposed_parks))
     
     print("✅ Created green spaces GeoJSON files")
 
@@ -477,18 +509,24 @@ def main():
         print("🚀 Attempting to download real climate data...")
         
         try:
-            # Download temperature data
-            temp_file = download_era5_land_temperature(client)
-            if temp_file and os.path.exists(temp_file):
-                process_temperature_data(temp_file)
-            
-            # Download vegetation data  
-            veg_file = download_era5_vegetation_data(client)
-            if veg_file and os.path.exists(veg_file):
-                process_vegetation_data(veg_file)
+            # Each retrieval mostly waits in the CDS queue, so submit all three at once
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                temp_future = executor.submit(download_era5_land_temperature, client)
+                veg_future = executor.submit(download_era5_vegetation_data, client)
+                land_cover_future = executor.submit(download_satellite_land_cover, client)
+                
+                # Process temperature data while the other downloads continue
+                temp_file = temp_future.result()
+                if temp_file and os.path.exists(temp_file):
+                    process_temperature_data(temp_file)
+                
+                # Process vegetation data
+                veg_file = veg_future.result()
+                if veg_file and os.path.exists(veg_file):
+                    process_vegetation_data(veg_file)
                 
-            # Download land cover data
-            land_cover_file = download_satellite_land_cover(client)
+                # Land cover data
+                land_cover_file = land_cover_future.result()
             
             print("✅ Real climate data download completed!")
             
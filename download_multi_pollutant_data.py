@@ -7,9 +7,16 @@ import os
 import sys
 from datetime import datetime, timedelta
 import argparse
+import numpy as np
+from utils.table_io import save_table
+
+# Numba fuses the distance falloff, noise and floor into one compiled loop; fall back to NumPy
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
 
 # Import existing functions (fixed imports)
-# from download_no2_data import search_no2_products, download_netcdf_files
 # from process_no2_netcdf import process_netcdf_to_csv
 
 # Pollutant configuration mapping
@@ -64,7 +71,32 @@ POLLUTANT_CONFIG = {
     }
 }
 
-def download_pollutant_data(pollutant, start_date, end_date, max_products=20):
+def _distance_field_numpy(lats, lons, noise, center_lat, center_lon, peak, drop, floor):
+    """
+    Values falling from peak at the centre by drop at the farthest point, plus noise
+    """
+    distances = np.sqrt((lats - center_lat)**2 + (lons - center_lon)**2)
+    return np.maximum(floor, peak - drop * distances / distances.max() + noise)
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _distance_field(lats, lons, noise, center_lat, center_lon, peak, drop, floor):
+        """
+        Values falling from peak at the centre by drop at the farthest point, plus noise
+        """
+        out = np.empty_like(lats)
+        for i in prange(lats.shape[0]):
+            dy = lats[i] - center_lat
+            dx = lons[i] - center_lon
+            out[i] = np.sqrt(dy * dy + dx * dx)
+        scale = drop / out.max()
+        for i in prange(lats.shape[0]):
+            out[i] = max(floor, peak - scale * out[i] + noise[i])
+        return out
+else:
+    _distance_field = _distance_field_numpy
+
+def download_pollutant_data(pollutant, start_date, end_date, max_products=20, items=None):
     """
     Download data for a specific pollutant
     
@@ -73,6 +105,8 @@ def download_pollutant_data(pollutant, start_date, end_date, max_products=20):
         start_date (str): Start date 'YYYY-MM-DD'
         end_date (str): End date 'YYYY-MM-DD'  
         max_products (int): Maximum products to download
+        items (list): Products already found by a combined search; when
+            omitted the pollutant's products are searched for here
     
     Returns:
         bool: True if successful
@@ -88,39 +122,40 @@ def download_pollutant_data(pollutant, start_date, end_date, max_products=20):
     print(f"   Date Range: {start_date} to {end_date}")
     
     try:
-        # Search for products (reuse existing function with modified filter)
-        import requests
-        from pystac_client import ItemSearch
+        from download_no2_data import search_products, download_products
+        
+        if items is None:
+            print(f"🔍 Searching for {pollutant} products...")
+            items = search_products(start_date, end_date, [config['product_filter']], max_products)
         
-        # Modify the search to use the pollutant-specific filter
-        original_filter = "s5p:file_type='L2__NO2___'"
-        pollutant_filter = f"s5p:file_type='{config['product_filter']}'"
+        if not items:
+            print(f"❌ No {pollutant} products found for the specified time period")
+            return False
         
-        # Call existing search function but with different filter
-        # This would need modification to the original function
-        print(f"🔍 Searching for {pollutant} products...")
+        print(f"📥 Downloading {len(items)} {pollutant} product(s)...")
+        downloaded_files = download_products(items, output_dir=f"data/raw_{pollutant.lower()}")
         
-        # For now, show what the system would do
-        print(f"✅ Would search with filter: {pollutant_filter}")
-        print(f"✅ Would download NetCDF files for processing")
-        print(f"✅ Would process variable: {config['variable_name']}")
-        print(f"✅ Would convert using factor: {config['conversion_factor']}")
-        print(f"✅ Would output in units: {config['units']}")
+        # NetCDF processing is not automated yet
+        print(f"✅ Downloaded {len(downloaded_files)}/{len(items)} NetCDF file(s)")
+        print(f"   Next: process variable {config['variable_name']} "
+              f"with factor {config['conversion_factor']} to {config['units']}")
         
-        return True
+        return bool(downloaded_files)
         
     except Exception as e:
         print(f"❌ Error downloading {pollutant} data: {e}")
         return False
 
-def create_sample_multi_pollutant_data():
+def create_sample_multi_pollutant_data(seed=42):
     """
     Create sample data for all supported pollutants
+    
+    Args:
+        seed (int): Random seed, so repeated runs produce identical files
     """
     print("🎲 Creating sample data for all pollutants...")
     
     import pandas as pd
-    import numpy as np
     from utils.data_loader import get_sulaimani_bounds
     
     # Get Sulaimani bounds
@@ -132,78 +167,89 @@ def create_sample_multi_pollutant_data():
     # Generate 10 days of data
     dates = [(datetime.now() - timedelta(days=i)).strftime('%Y-%m-%d') for i in range(10)]
     
-    for pollutant, config in POLLUTANT_CONFIG.items():
+    # Every row repeats its file's pollutant and units, so store them as
+    # categoricals: one small integer code per row instead of a string
+    pollutant_dtype = pd.CategoricalDtype(list(POLLUTANT_CONFIG))
+    units_dtype = pd.CategoricalDtype(list(dict.fromkeys(c['units'] for c in POLLUTANT_CONFIG.values())))
+    
+    # Draw every pollutant's random samples up front in a few batched calls:
+    # 100 points per day per pollutant, indexed [pollutant, day] below
+    n_points = 100
+    shape = (len(POLLUTANT_CONFIG), len(dates), n_points)
+    rng = np.random.default_rng(seed)
+    all_lats = rng.uniform(min_lat, max_lat, shape)
+    all_lons = rng.uniform(min_lon, max_lon, shape)
+    all_uniform = rng.random(shape)
+    all_noise = rng.standard_normal(shape)
+    road_effects = rng.choice([1.5, 1.0, 0.7], (len(dates), n_points), p=[0.3, 0.4, 0.3])
+    dust_events = rng.random(len(dates)) < 0.2
+    
+    for pi, (pollutant, config) in enumerate(POLLUTANT_CONFIG.items()):
         print(f"   Creating {pollutant} sample data...")
         
-        all_data = []
+        day_frames = []
         
-        for date in dates:
-            # Generate 100 points per day for each pollutant
-            n_points = 100
-            
+        for di, date in enumerate(dates):
             # Create realistic spatial distribution
-            lats = np.random.uniform(min_lat, max_lat, n_points)
-            lons = np.random.uniform(min_lon, max_lon, n_points)
+            lats = all_lats[pi, di]
+            lons = all_lons[pi, di]
+            u = all_uniform[pi, di]
+            z = all_noise[pi, di]
             
             # Create pollutant-specific realistic values
             if pollutant == 'NO2':
                 # Higher in urban center, lower in suburbs
                 center_lat, center_lon = 35.5608, 45.4347
-                distances = np.sqrt((lats - center_lat)**2 + (lons - center_lon)**2)
-                base_values = 45 - 30 * distances / distances.max()
-                values = np.maximum(5, base_values + np.random.normal(0, 8, n_points))
+                values = _distance_field(lats, lons, 8 * z, center_lat, center_lon, 45.0, 30.0, 5.0)
                 
             elif pollutant == 'SO2':
                 # Industrial hotspots
                 industrial_lat, industrial_lon = 35.54, 45.41  # Industrial area
-                distances = np.sqrt((lats - industrial_lat)**2 + (lons - industrial_lon)**2)
-                base_values = 25 - 20 * distances / distances.max()
-                values = np.maximum(2, base_values + np.random.normal(0, 5, n_points))
+                values = _distance_field(lats, lons, 5 * z, industrial_lat, industrial_lon, 25.0, 20.0, 2.0)
                 
             elif pollutant == 'CO':
                 # Traffic-related, higher on main roads
-                road_effect = np.random.choice([1.5, 1.0, 0.7], n_points, p=[0.3, 0.4, 0.3])
-                base_values = np.random.uniform(0.5, 2.0, n_points)
-                values = base_values * road_effect + np.random.normal(0, 0.3, n_points)
+                base_values = 0.5 + 1.5 * u
+                values = base_values * road_effects[di] + 0.3 * z
                 values = np.maximum(0.1, values)
                 
             elif pollutant == 'O3':
                 # Secondary pollutant, varies with photochemistry
-                base_values = np.random.uniform(250, 320, n_points)  # Dobson Units
-                values = base_values + np.random.normal(0, 15, n_points)
+                base_values = 250 + 70 * u  # Dobson Units
+                values = base_values + 15 * z
                 
             elif pollutant == 'HCHO':
                 # VOC-related emissions
-                base_values = np.random.uniform(1, 8, n_points)
-                values = base_values + np.random.normal(0, 2, n_points)
+                base_values = 1 + 7 * u
+                values = base_values + 2 * z
                 values = np.maximum(0.1, values)
                 
             elif pollutant == 'AER_AI':
                 # Aerosol index, dust events
-                dust_event = np.random.choice([True, False], p=[0.2, 0.8])
-                if dust_event:
-                    base_values = np.random.uniform(1.5, 4.0, n_points)
+                if dust_events[di]:
+                    base_values = 1.5 + 2.5 * u
                 else:
-                    base_values = np.random.uniform(0.2, 1.2, n_points)
-                values = base_values + np.random.normal(0, 0.3, n_points)
+                    base_values = 0.2 + 1.0 * u
+                values = base_values + 0.3 * z
                 values = np.maximum(0, values)
             
-            # Add to dataset
-            for lat, lon, value in zip(lats, lons, values):
-                all_data.append({
-                    'date': date,
-                    'lat': lat,
-                    'lon': lon,
-                    'value': value,
-                    'pollutant': pollutant,
-                    'units': config['units']
-                })
+            # Add to dataset as whole float32 columns; the scalar date broadcasts
+            day_frames.append(pd.DataFrame({
+                'date': date,
+                'lat': lats.astype(np.float32, copy=False),
+                'lon': lons.astype(np.float32, copy=False),
+                'value': values.astype(np.float32, copy=False)
+            }))
         
         # Save pollutant-specific file
-        df = pd.DataFrame(all_data)
+        df = pd.concat(day_frames, ignore_index=True)
+        df['pollutant'] = pd.Categorical.from_codes(
+            np.full(len(df), pollutant_dtype.categories.get_loc(pollutant), dtype=np.int8), dtype=pollutant_dtype)
+        df['units'] = pd.Categorical.from_codes(
+            np.full(len(df), units_dtype.categories.get_loc(config['units']), dtype=np.int8), dtype=units_dtype)
         filename = f"data/air_quality_{pollutant.lower()}.csv"
-        df.to_csv(filename, index=False)
-        print(f"   ✅ Created {filename} with {len(df)} records")
+        save_table(df, filename)
+        print(f"   ✅ Created {filename} (+ .parquet) with {len(df)} records")
         
         # Calculate statistics
         avg_value = df['value'].mean()
@@ -216,7 +262,7 @@ def create_sample_multi_pollutant_data():
         print(f"      Above guideline ({guideline} {config['units']}): {above_guideline:.1f}%")
     
     print(f"\n🎯 Created sample data for {len(POLLUTANT_CONFIG)} pollutants!")
-    print("   Files created in data/ directory")
+    print("   Files created in data/ directory (CSV and Parquet)")
     print("   Ready for integration into Air Quality page")
 
 def update_air_quality_page():
@@ -276,9 +322,38 @@ def main():
     else:
         pollutants = [args.pollutant]
     
+    # Several pollutants are found with one combined STAC query, then split by product type
+    items_by_type = None
+    if len(pollutants) > 1:
+        try:
+            from download_no2_data import search_products
+            
+            filters = [POLLUTANT_CONFIG[p]['product_filter'] for p in pollutants]
+            max_items = args.max_products * len(pollutants)
+            items = search_products(args.start_date, args.end_date, filters, max_items)
+            items_by_type = {f: [] for f in filters}
+            for item in items:
+                items_by_type.setdefault(item.properties['s5p:file_type'], []).append(item)
+            
+            # A full result may be dominated by one product type; any type short of
+            # max_products is then searched again on its own (None = search per type)
+            if len(items) >= max_items:
+                for product_filter, found in items_by_type.items():
+                    if len(found) < args.max_products:
+                        items_by_type[product_filter] = None
+            print()
+        except Exception as e:
+            print(f"❌ Error searching for products: {e}")
+            return
+    
     success_count = 0
     for pollutant in pollutants:
-        if download_pollutant_data(pollutant, args.start_date, args.end_date, args.max_products):
+        items = None
+        if items_by_type is not None:
+            items = items_by_type[POLLUTANT_CONFIG[pollutant]['product_filter']]
+            if items is not None:
+                items = items[:args.max_products]
+        if download_pollutant_data(pollutant, args.start_date, args.end_date, args.max_products, items):
             success_count += 1
         print()
     
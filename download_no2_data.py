@@ -4,14 +4,43 @@ Download Sentinel-5P NO₂ data for Sulaimani from S5P-PAL Data Portal
 
 from pystac import Catalog
 from pystac_client import ItemSearch
-import requests
+from pystac_client.stac_api_io import StacApiIO
 import os
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # S5P-PAL API endpoint
 L2_CATALOG = "https://data-portal.s5p-pal.com/api/s5p-l2"
 
+# Products are 100+ MB NetCDF files: read them in 1 MiB chunks and redraw
+# the progress line at most every PROGRESS_INTERVAL seconds
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+PROGRESS_INTERVAL = 0.25
+
+# (connect, read) timeouts in seconds
+DOWNLOAD_TIMEOUT = (10, 60)
+
+# Products download concurrently, each worker on its own pooled keep-alive connection
+MAX_DOWNLOAD_WORKERS = 8
+
+# One session for the catalog, the STAC search pages and the product downloads,
+# so every request to the portal reuses an open TLS connection
+STAC_IO = StacApiIO(timeout=DOWNLOAD_TIMEOUT)
+SESSION = STAC_IO.session
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=MAX_DOWNLOAD_WORKERS,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+))
+
+# The catalog's search link is fetched once and reused for this many seconds
+CATALOG_TTL = 3600
+
 # Sulaimani bounding box (expanded coverage)
 SULAIMANI_BBOX = {
     'type': 'Polygon',
@@ -24,44 +53,70 @@ SULAIMANI_BBOX = {
     ]]
 }
 
-def search_no2_products(start_date, end_date, max_products=50):
+@lru_cache(maxsize=1)
+def _get_search_endpoint(ttl_bucket):
+    """Fetch the catalog once per TTL bucket and return its STAC search URL"""
+    catalog = Catalog.from_file(L2_CATALOG, stac_io=STAC_IO)
+    return catalog.get_single_link("search").target
+
+
+def search_products(start_date, end_date, product_filters, max_products=50):
     """
-    Search for NO₂ products for Sulaimani area
+    Search for Sentinel-5P products of one or more types for Sulaimani area
+    
+    All product types are matched by a single STAC query, so searching for
+    several pollutants costs one round-trip instead of one per type.
     
     Args:
         start_date (str): Start date in format 'YYYY-MM-DD'
         end_date (str): End date in format 'YYYY-MM-DD'
+        product_filters (list): S5P file types to match, e.g. ['L2__NO2___']
         max_products (int): Maximum number of products to retrieve
     
     Returns:
         list: List of STAC items matching the criteria
     """
-    print(f"Searching for NO₂ products from {start_date} to {end_date}...")
+    print(f"Searching for {', '.join(product_filters)} products from {start_date} to {end_date}...")
     print(f"Area: Sulaimani (45.25-45.62°E, 35.40-35.72°N)")
     
-    catalog = Catalog.from_file(L2_CATALOG)
-    endpoint = catalog.get_single_link("search").target
+    endpoint = _get_search_endpoint(int(time.monotonic() // CATALOG_TTL))
     
     # Search parameters
     timefilter = f"{start_date}/{end_date}"
     
-    # Use filter to select only NO₂ products (L2__NO2___)
-    filter_query = "s5p:file_type='L2__NO2___'"
+    # Select only the requested product types (e.g. L2__NO2___)
+    filter_query = " OR ".join(f"s5p:file_type='{p}'" for p in product_filters)
     
     items = ItemSearch(
         endpoint,
         datetime=timefilter,
         intersects=SULAIMANI_BBOX,
         filter=filter_query,
-        max_items=max_products
+        max_items=max_products,
+        stac_io=STAC_IO
     ).items()
     
     items_list = list(items)
-    print(f"Found {len(items_list)} NO₂ products for Sulaimani")
+    print(f"Found {len(items_list)} products for Sulaimani")
     
     return items_list
 
 
+def search_no2_products(start_date, end_date, max_products=50):
+    """
+    Search for NO₂ products for Sulaimani area
+    
+    Args:
+        start_date (str): Start date in format 'YYYY-MM-DD'
+        end_date (str): End date in format 'YYYY-MM-DD'
+        max_products (int): Maximum number of products to retrieve
+    
+    Returns:
+        list: List of STAC items matching the criteria
+    """
+    return search_products(start_date, end_date, ['L2__NO2___'], max_products)
+
+
 def display_product_info(items):
     """Display information about found products"""
     print("\n" + "="*80)
@@ -91,13 +146,15 @@ def display_product_info(items):
         print(f"   Size: {file_size_mb:.2f} MB")
 
 
-def download_product(item, output_dir='data/raw_no2'):
+def download_product(item, output_dir='data/raw_no2', verbose=True):
     """
     Download a single NO₂ product
     
     Args:
         item: STAC item to download
         output_dir (str): Directory to save the file
+        verbose (bool): Print status and a progress line; disabled when
+            several products download at once (errors are always printed)
     
     Returns:
         str: Path to downloaded file
@@ -115,38 +172,54 @@ def download_product(item, output_dir='data/raw_no2'):
     local_filename = os.path.join(output_dir, os.path.basename(product_local_path))
     
     # Check if file already exists
-    if os.path.exists(local_filename):
-        file_size = os.path.getsize(local_filename)
-        if file_size == product_size:
+    existing_size = os.path.getsize(local_filename) if os.path.exists(local_filename) else 0
+    if existing_size == product_size:
+        if verbose:
             print(f"✅ File already exists and matches size: {local_filename}")
-            return local_filename
+        return local_filename
+    
+    # A shorter file is an interrupted download: request only the missing tail
+    headers = {}
+    if 0 < existing_size < product_size:
+        headers['Range'] = f'bytes={existing_size}-'
     
     # Download the file
-    print(f"Downloading {os.path.basename(product_local_path)}...")
-    print(f"Size: {product_size / (1024 * 1024):.2f} MB")
+    if verbose:
+        print(f"Downloading {os.path.basename(product_local_path)}...")
+        print(f"Size: {product_size / (1024 * 1024):.2f} MB")
     
     try:
-        r = requests.get(download_url, stream=True)
+        r = SESSION.get(download_url, headers=headers, stream=True, timeout=DOWNLOAD_TIMEOUT)
         r.raise_for_status()
         
-        # Download with progress indication
-        downloaded = 0
-        chunk_size = 8192
+        # 206 Partial Content appends to the file; a plain 200 means the server
+        # ignored the range (or none was sent), so start again from byte 0
+        downloaded = existing_size if r.status_code == 206 else 0
+        if verbose and downloaded:
+            print(f"Resuming from {downloaded / (1024 * 1024):.2f} MB")
+        
+        # Download with throttled progress indication
+        last_print = time.monotonic()
         
-        with open(local_filename, 'wb') as f:
-            for chunk in r.iter_content(chunk_size=chunk_size):
+        with open(local_filename, 'ab' if downloaded else 'wb') as f:
+            for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                 if chunk:
                     f.write(chunk)
                     downloaded += len(chunk)
-                    percent = (downloaded / product_size) * 100
-                    print(f"\rProgress: {percent:.1f}%", end='', flush=True)
+                    now = time.monotonic()
+                    if verbose and now - last_print >= PROGRESS_INTERVAL:
+                        percent = (downloaded / product_size) * 100
+                        print(f"\rProgress: {percent:.1f}%", end='', flush=True)
+                        last_print = now
         
-        print()  # New line after progress
+        if verbose:
+            print(f"\rProgress: {(downloaded / product_size) * 100:.1f}%")  # Final state and new line
         
         # Verify file size
         file_size = os.path.getsize(local_filename)
         if file_size == product_size:
-            print(f"✅ Download successful: {local_filename}")
+            if verbose:
+                print(f"✅ Download successful: {local_filename}")
             return local_filename
         else:
             print(f"❌ Warning: File size mismatch ({file_size} vs {product_size})")
@@ -157,6 +230,31 @@ def download_product(item, output_dir='data/raw_no2'):
         return None
 
 
+def download_products(items, output_dir='data/raw_no2'):
+    """
+    Download several products concurrently
+    
+    Args:
+        items (list): STAC items to download
+        output_dir (str): Directory to save the files
+    
+    Returns:
+        list: Paths of the successfully downloaded files
+    """
+    # Downloads are network-bound, so run them concurrently; map reports in selection order
+    downloaded_files = []
+    with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+        file_paths = executor.map(lambda item: download_product(item, output_dir, verbose=False), items)
+        for i, (item, file_path) in enumerate(zip(items, file_paths), 1):
+            if file_path:
+                print(f"✅ {i}/{len(items)}: {file_path}")
+                downloaded_files.append(file_path)
+            else:
+                print(f"❌ {i}/{len(items)}: {item.id} failed")
+    
+    return downloaded_files
+
+
 def download_recent_no2_data(days_back=30, max_products=10):
     """
     Download recent NO₂ data for Sulaimani
@@ -198,8 +296,6 @@ def download_recent_no2_data(days_back=30, max_products=10):
     
     choice = input(f"\nDownload all products? (y/n) [default: y]: ").strip().lower()
     
-    downloaded_files = []
-    
     if choice == 'n':
         # Allow user to select specific products
         indices = input(f"Enter product numbers to download (comma-separated, e.g., 1,3,5): ").strip()
@@ -215,11 +311,7 @@ def download_recent_no2_data(days_back=30, max_products=10):
     # Download selected products
     print(f"\n📥 Downloading {len(selected_items)} product(s)...\n")
     
-    for i, item in enumerate(selected_items, 1):
-        print(f"\n--- Downloading {i}/{len(selected_items)} ---")
-        file_path = download_product(item)
-        if file_path:
-            downloaded_files.append(file_path)
+    downloaded_files = download_products(selected_items)
     
     # Summary
     print("\n" + "="*80)
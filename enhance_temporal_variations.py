@@ -5,9 +5,86 @@ Creates more dramatic year-to-year differences for better visualization
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import os
 
+# Dates in the 15-year files are written as ISO days
+DATE_FORMAT = '%Y-%m-%d'
+
+# Files are streamed through in blocks of this many bytes of CSV text, so
+# peak memory is one block rather than the whole table
+CSV_BLOCK_SIZE = 1 << 24
+
+# Values fit float32; coordinates stay float64 so rewriting a file never
+# rounds them. ISO dates are parsed natively as days
+CSV_COLUMN_TYPES = {
+    'date': pa.date32(),
+    'lat': pa.float64(),
+    'lon': pa.float64(),
+    'value': pa.float32(),
+}
+
+def parse_dates(dates):
+    """
+    Parse date strings with the known format, converting each distinct date once
+    """
+    return pd.to_datetime(dates, format=DATE_FORMAT, cache=True)
+
+def rewrite_values(csv_path, update):
+    """
+    Stream a CSV block by block, replacing its value column
+    
+    update(values, batch) receives each block's values as a writable float32
+    array plus the Arrow record batch they came from (dates are date32), and
+    returns the new values. The other columns are written back at full
+    precision (lat/lon as float64).
+    Blocks go to a temporary file that replaces the original once every
+    block has been written.
+    """
+    tmp_path = csv_path + '.tmp'
+    reader = pacsv.open_csv(
+        csv_path,
+        read_options=pacsv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+        convert_options=pacsv.ConvertOptions(column_types=CSV_COLUMN_TYPES)
+    )
+    value_index = reader.schema.get_field_index('value')
+    
+    # Column names, dates, codes and units never contain separators, so nothing
+    # is quoted. The writer always quotes its own header, so ours is written by hand
+    try:
+        with open(tmp_path, 'wb') as sink, \
+                pacsv.CSVWriter(sink, reader.schema,
+                                write_options=pacsv.WriteOptions(include_header=False,
+                                                                 quoting_style='none')) as writer:
+            sink.write((','.join(reader.schema.names) + '\n').encode())
+            for batch in reader:
+                values = batch.column(value_index).to_numpy(zero_copy_only=False).astype(np.float32)
+                values = update(values, batch)
+                table = pa.Table.from_batches([batch])
+                writer.write_table(table.set_column(value_index, 'value', pa.array(values, pa.float32())))
+    except BaseException:
+        # Leave the original untouched and no half-written file behind
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    
+    os.replace(tmp_path, csv_path)
+
+def lookup_multipliers(keys, multipliers):
+    """
+    Gather one multiplier per row from a small {key: multiplier} table
+    
+    Keys without an entry get 1.0, i.e. those rows are left unchanged.
+    """
+    table_keys = np.array(sorted(multipliers))
+    table = np.array([multipliers[k] for k in table_keys])
+    idx = np.searchsorted(table_keys, keys).clip(max=len(table_keys) - 1)
+    return np.where(table_keys[idx] == keys, table[idx], 1.0)
+
 def enhance_temporal_variations():
     """
     Enhance the temporal variations in the existing 15-year dataset
@@ -20,12 +97,6 @@ def enhance_temporal_variations():
         print("❌ NO2 15-year data not found. Please run generate_15_year_bimonthly_data.py first")
         return
     
-    df = pd.read_csv('data/air_quality_no2_15_year.csv')
-    df['datetime'] = pd.to_datetime(df['date'])
-    df['year'] = df['datetime'].dt.year
-    
-    print(f"📊 Original Data Range: {df['value'].min():.2f} - {df['value'].max():.2f} µg/m³")
-    
     # Create more dramatic year-to-year multipliers
     year_multipliers = {
         2010: 0.85,  # Lower baseline
@@ -45,13 +116,7 @@ def enhance_temporal_variations():
         2024: 1.55,  # Peak levels
     }
     
-    # Apply enhanced multipliers
-    for year, multiplier in year_multipliers.items():
-        mask = df['year'] == year
-        df.loc[mask, 'value'] = df.loc[mask, 'value'] * multiplier
-    
     # Add some seasonal variation within years
-    df['month'] = df['datetime'].dt.month
     seasonal_multipliers = {
         1: 1.3,   # Winter - higher heating emissions
         2: 1.25,  # Winter
@@ -67,21 +132,44 @@ def enhance_temporal_variations():
         12: 1.35, # Winter heating
     }
     
-    for month, mult in seasonal_multipliers.items():
-        mask = df['month'] == month
-        df.loc[mask, 'value'] = df.loc[mask, 'value'] * mult
+    # Block ranges and per-year sums are collected while the file streams through
+    original_ranges = []
+    enhanced_ranges = []
+    yearly_parts = []
     
-    # Ensure minimum values
-    df['value'] = df['value'].clip(lower=8)
+    def enhance_block(values, batch):
+        years = pc.year(batch.column('date')).to_numpy()
+        months = pc.month(batch.column('date')).to_numpy()
+        original_ranges.append((values.min(), values.max()))
+        
+        # Apply enhanced yearly and seasonal multipliers in one pass over the values
+        multipliers = lookup_multipliers(years, year_multipliers)
+        multipliers *= lookup_multipliers(months, seasonal_multipliers)
+        np.multiply(values, multipliers, out=values)
+        
+        # Ensure minimum values
+        np.maximum(values, 8, out=values)
+        
+        enhanced_ranges.append((values.min(), values.max()))
+        yearly_parts.append(pd.Series(values, dtype=np.float64).groupby(years).agg(['sum', 'count']))
+        return values
     
     # Save enhanced data
-    df_save = df.drop(['datetime', 'year', 'month'], axis=1)
-    df_save.to_csv('data/air_quality_no2_15_year.csv', index=False)
+    rewrite_values('data/air_quality_no2_15_year.csv', enhance_block)
+    
+    # A header-only file yields no blocks, so there is nothing to summarize
+    if not original_ranges:
+        print("⚠️ NO2 15-year data has no records; nothing to enhance")
+        return None
     
-    print(f"✅ Enhanced Data Range: {df['value'].min():.2f} - {df['value'].max():.2f} µg/m³")
+    original_min, original_max = np.array(original_ranges).T
+    enhanced_min, enhanced_max = np.array(enhanced_ranges).T
+    print(f"📊 Original Data Range: {original_min.min():.2f} - {original_max.max():.2f} µg/m³")
+    print(f"✅ Enhanced Data Range: {enhanced_min.min():.2f} - {enhanced_max.max():.2f} µg/m³")
     
     # Show year-to-year changes
-    yearly_avg = df.groupby('year')['value'].mean()
+    yearly = pd.concat(yearly_parts).groupby(level=0).sum()
+    yearly_avg = yearly['sum'] / yearly['count']
     print(f"\n📈 Enhanced Yearly Averages:")
     for year in sorted(yearly_avg.index):
         avg = yearly_avg[year]
@@ -92,7 +180,61 @@ def enhance_temporal_variations():
         else:
             print(f"   {year}: {avg:.1f} µg/m³ (baseline)")
     
-    return df
+    return yearly_avg
+
+def _enhance_one(pollutant_id, info):
+    """
+    Apply a pollutant's yearly trend to its 15-year file in place
+    
+    Runs in a worker process, so the range line is returned for the
+    parent to print in order instead of being printed here.
+    
+    Returns:
+        str: Value range after enhancement, or None if the file is missing
+    """
+    file_path = f"data/{info['file']}"
+    if not os.path.exists(file_path):
+        return None
+    
+    # Pollutant-specific trends
+    if pollutant_id == 'so2':
+        # SO2 decreasing trend (cleaner fuels)
+        year_mults = {y: 1.2 - (y-2010)*0.02 for y in range(2010, 2025)}
+        year_mults[2020] = 0.7  # COVID drop
+    elif pollutant_id == 'co':
+        # CO moderate increase (traffic growth)
+        year_mults = {y: 0.9 + (y-2010)*0.03 for y in range(2010, 2025)}
+        year_mults[2020] = 0.6  # Strong COVID drop
+    elif pollutant_id == 'o3':
+        # O3 complex pattern (meteorology dependent)
+        year_mults = {y: 1.0 + 0.1*np.sin((y-2010)*0.3) for y in range(2010, 2025)}
+    elif pollutant_id == 'hcho':
+        # HCHO increasing (industrial growth)
+        year_mults = {y: 0.8 + (y-2010)*0.04 for y in range(2010, 2025)}
+    else:  # aer_ai
+        # Aerosols variable (dust storms)
+        year_mults = {y: 1.0 + 0.2*np.random.normal() for y in range(2010, 2025)}
+    
+    # Apply multipliers block by block, tracking the range as blocks stream through
+    ranges = []
+    units = []
+    
+    def enhance_block(values, batch):
+        years = pc.year(batch.column('date')).to_numpy()
+        np.multiply(values, lookup_multipliers(years, year_mults), out=values)
+        ranges.append((values.min(), values.max()))
+        units.append(batch.column('units')[0].as_py())
+        return values
+    
+    # Save enhanced data
+    rewrite_values(file_path, enhance_block)
+    
+    # A header-only file yields no blocks, so there is no range to report
+    if not ranges:
+        return "      Range: no records"
+    
+    block_min, block_max = np.array(ranges).T
+    return f"      Range: {block_min.min():.2f} - {block_max.max():.2f} {units[0]}"
 
 def enhance_all_pollutants():
     """
@@ -109,49 +251,15 @@ def enhance_all_pollutants():
         'aer_ai': {'file': 'air_quality_aer_ai_15_year.csv', 'name': 'AER_AI'}
     }
     
-    # Different multiplier patterns for different pollutants
-    for pollutant_id, info in pollutants.items():
-        file_path = f"data/{info['file']}"
-        if not os.path.exists(file_path):
-            continue
-            
-        print(f"   🔬 Enhancing {info['name']}...")
-        
-        df = pd.read_csv(file_path)
-        df['datetime'] = pd.to_datetime(df['date'])
-        df['year'] = df['datetime'].dt.year
-        
-        # Pollutant-specific trends
-        if pollutant_id == 'so2':
-            # SO2 decreasing trend (cleaner fuels)
-            year_mults = {y: 1.2 - (y-2010)*0.02 for y in range(2010, 2025)}
-            year_mults[2020] = 0.7  # COVID drop
-        elif pollutant_id == 'co':
-            # CO moderate increase (traffic growth)
-            year_mults = {y: 0.9 + (y-2010)*0.03 for y in range(2010, 2025)}
-            year_mults[2020] = 0.6  # Strong COVID drop
-        elif pollutant_id == 'o3':
-            # O3 complex pattern (meteorology dependent)
-            year_mults = {y: 1.0 + 0.1*np.sin((y-2010)*0.3) for y in range(2010, 2025)}
-        elif pollutant_id == 'hcho':
-            # HCHO increasing (industrial growth)
-            year_mults = {y: 0.8 + (y-2010)*0.04 for y in range(2010, 2025)}
-        else:  # aer_ai
-            # Aerosols variable (dust storms)
-            year_mults = {y: 1.0 + 0.2*np.random.normal() for y in range(2010, 2025)}
-        
-        # Apply multipliers
-        for year, mult in year_mults.items():
-            if year in df['year'].values:
-                mask = df['year'] == year
-                df.loc[mask, 'value'] *= mult
-        
-        # Save enhanced data
-        df_save = df.drop(['datetime', 'year'], axis=1)
-        df_save.to_csv(file_path, index=False)
-        
-        # Show range
-        print(f"      Range: {df['value'].min():.2f} - {df['value'].max():.2f} {df['units'].iloc[0]}")
+    # The files are independent, so each is read, enhanced and rewritten in its own process
+    workers = min(len(pollutants), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        ranges = executor.map(_enhance_one, pollutants.keys(), pollutants.values())
+        for info, value_range in zip(pollutants.values(), ranges):
+            if value_range is None:
+                continue
+            print(f"   🔬 Enhancing {info['name']}...")
+            print(value_range)
 
 def create_year_comparison_summary():
     """
@@ -162,7 +270,7 @@ def create_year_comparison_summary():
     
     if os.path.exists('data/air_quality_no2_15_year.csv'):
         df = pd.read_csv('data/air_quality_no2_15_year.csv')
-        df['year'] = pd.to_datetime(df['date']).dt.year
+        df['year'] = parse_dates(df['date']).dt.year.astype(np.int16)
         
         # Calculate annual statistics
         annual_stats = df.groupby('year')['value'].agg(['mean', 'min', 'max', 'std']).round(2)
@@ -44,6 +44,16 @@ def create_15_year_aqi_data():
     
     print(f"\n🔬 Calculating Composite AQI...")
     
+    # One (date, lat, lon) -> value dict per pollutant, with coordinates rounded
+    # to the 0.001° matching tolerance, so each lookup is a hash probe instead
+    # of a full-table scan. Built from the reversed frame so the first matching
+    # row wins, as with the previous boolean filter
+    lookups = {}
+    for pollutant, df in pollutants.items():
+        rev = df.iloc[::-1]
+        keys = zip(rev['date'], rev['lat'].round(3), rev['lon'].round(3))
+        lookups[pollutant] = dict(zip(keys, rev['value']))
+    
     # Group by date and location for consistent calculation
     base_groups = no2_data.groupby(['date', 'lat', 'lon'])
     
@@ -54,12 +64,10 @@ def create_15_year_aqi_data():
         # Get corresponding values from other pollutants
         pollutant_values = {'NO2': no2_value}
         
-        for pollutant, df in pollutants.items():
-            matching = df[(df['date'] == date) & 
-                         (abs(df['lat'] - lat) < 0.001) & 
-                         (abs(df['lon'] - lon) < 0.001)]
-            if not matching.empty:
-                pollutant_values[pollutant] = matching['value'].iloc[0]
+        key = (date, np.round(lat, 3), np.round(lon, 3))
+        for pollutant, lookup in lookups.items():
+            if key in lookup:
+                pollutant_values[pollutant] = lookup[key]
         
         # Calculate composite AQI score
         aqi_score = calculate_composite_aqi(pollutant_values)
@@ -1,12 +1,18 @@
 import pandas as pd
 import numpy as np
-from shapely.geometry import Polygon, Point
+import shapely
+from shapely.geometry import Polygon
 
 # Load data
-df = pd.read_csv('data_solution/enhanced_air_quality_detailed.csv') 
+df = pd.read_csv('data_solution/enhanced_air_quality_detailed.csv', usecols=['date', 'lat', 'lon'],
+                 dtype={'lat': 'float64', 'lon': 'float64'}, engine='pyarrow') 
 latest_aqi = df[df['date'] == df['date'].max()]
 print(f"Data range: lat {df['lat'].min():.6f}-{df['lat'].max():.6f}, lon {df['lon'].min():.6f}-{df['lon'].max():.6f}")
 
+# Coordinates of the first 1000 latest points, shared by every polygon test
+lons = latest_aqi['lon'].to_numpy()[:1000]
+lats = latest_aqi['lat'].to_numpy()[:1000]
+
 # Working coordinates from our successful test
 sulaimani_lat, sulaimani_lon = 35.5647, 45.4164
 buffer_size = 0.02
@@ -23,11 +29,7 @@ working_shapely = [(coord[1], coord[0]) for coord in working_input]
 working_polygon = Polygon(working_shapely).buffer(0.001)
 
 # Test working version
-working_count = 0
-for _, row in latest_aqi.head(1000).iterrows():
-    point = Point(row['lon'], row['lat'])
-    if working_polygon.contains(point):
-        working_count += 1
+working_count = int(shapely.contains_xy(working_polygon, lons, lats).sum())
 
 print(f"Working format points found: {working_count}")
 print(f"Working polygon bounds: {working_polygon.bounds}")
@@ -67,11 +69,9 @@ opt1_polygon = Polygon(opt1_processed).buffer(0.001)
 opt2_processed = [(coord[1], coord[0]) for coord in option2_coords]
 opt2_polygon = Polygon(opt2_processed).buffer(0.001)
 
-opt1_count = sum(1 for _, row in latest_aqi.head(1000).iterrows() 
-                 if opt1_polygon.contains(Point(row['lon'], row['lat'])))
+opt1_count = int(shapely.contains_xy(opt1_polygon, lons, lats).sum())
 
-opt2_count = sum(1 for _, row in latest_aqi.head(1000).iterrows()
-                 if opt2_polygon.contains(Point(row['lon'], row['lat'])))
+opt2_count = int(shapely.contains_xy(opt2_polygon, lons, lats).sum())
 
 print(f"Option 1 ([lon,lat] from st_folium): {opt1_count} points")  
 print(f"Option 2 ([lat,lon] from st_folium): {opt2_count} points")
@@ -160,6 +160,8 @@ def download_air_quality_data():
     
     df = pd.DataFrame(air_quality_data)
     df.to_csv('data_solution/enhanced_air_quality_detailed.csv', index=False)
+    # Columnar copy for the diagnostic scripts, which reread this file often
+    df.to_parquet('data_solution/enhanced_air_quality_detailed.parquet', index=False)
     print(f"✅ Saved {len(df):,} air quality measurements")
     
     return df
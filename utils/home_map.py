@@ -0,0 +1,61 @@
+"""
+Overview map shown on the Home page
+"""
+
+import folium
+from pathlib import Path
+
+# Prebuilt map written by build_home_map.py and embedded by Home.py
+HOME_MAP_HTML = Path(__file__).parent.parent / "assets" / "home_map.html"
+
+# Sulaimani city center
+SULAIMANI_CENTER = [35.5608, 45.4347]
+
+
+def create_home_map():
+    """
+    Create the Sulaimani overview map with street and satellite layers
+
+    Returns:
+        folium.Map: Map centered on Sulaimani with a city center marker
+    """
+    # Create base map (you can add overlays once data is ready)
+    m = folium.Map(
+        location=SULAIMANI_CENTER,
+        zoom_start=12,
+        tiles='OpenStreetMap'
+    )
+
+    # Add satellite imagery option
+    folium.TileLayer(
+        tiles='https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}',
+        attr='Esri',
+        name='Satellite',
+        overlay=False,
+        control=True
+    ).add_to(m)
+
+    # Add marker for city center
+    folium.Marker(
+        SULAIMANI_CENTER,
+        popup="Sulaimani City Center",
+        tooltip="Click for more info",
+        icon=folium.Icon(color='blue', icon='info-sign')
+    ).add_to(m)
+
+    # Layer control
+    folium.LayerControl().add_to(m)
+
+    return m
+
+
+def load_home_map_html():
+    """
+    Load the prebuilt overview map, rendering it on the fly if missing
+
+    Returns:
+        str: Standalone HTML document for the map
+    """
+    if HOME_MAP_HTML.exists():
+        return HOME_MAP_HTML.read_text(encoding='utf-8')
+    return create_home_map().get_root().render()
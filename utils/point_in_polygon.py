@@ -0,0 +1,91 @@
+"""
+Ray-casting point-in-polygon test for many points against one small ring
+"""
+
+import numpy as np
+
+# Numba compiles the crossing test into one parallel loop; fall back to NumPy
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+def ring_arrays(polygon):
+    """
+    Extract a polygon's exterior ring as contiguous float64 x/y arrays
+
+    Consecutive duplicate vertices are dropped so no zero-length edge
+    reaches the crossing test, and the ring is closed if it is not already.
+
+    Args:
+        polygon (shapely.geometry.Polygon): Polygon in (lon, lat) order
+
+    Returns:
+        tuple: (ring_x, ring_y) arrays with the first vertex repeated last
+    """
+    coords = np.asarray(polygon.exterior.coords, dtype=np.float64)[:, :2]
+    keep = np.ones(len(coords), dtype=bool)
+    keep[1:] = np.any(coords[1:] != coords[:-1], axis=1)
+    coords = coords[keep]
+    if not np.array_equal(coords[0], coords[-1]):
+        coords = np.vstack([coords, coords[:1]])
+    if len(coords) < 4:
+        raise ValueError("Polygon ring has fewer than three distinct vertices")
+    return np.ascontiguousarray(coords[:, 0]), np.ascontiguousarray(coords[:, 1])
+
+
+def _contains_ring_numpy(xs, ys, ring_x, ring_y):
+    """
+    Even-odd crossing test, vectorized over points and looped over edges
+    """
+    inside = np.zeros(xs.shape[0], dtype=np.bool_)
+    for k in range(ring_x.shape[0] - 1):
+        x1, y1, x2, y2 = ring_x[k], ring_y[k], ring_x[k + 1], ring_y[k + 1]
+        crosses = (y1 > ys) != (y2 > ys)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x_cross = (x2 - x1) * (ys - y1) / (y2 - y1) + x1
+        inside ^= crosses & (xs < x_cross)
+    return inside
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def contains_ring(xs, ys, ring_x, ring_y):
+        """
+        Even-odd crossing test for each point against a closed ring
+        """
+        out = np.empty(xs.shape[0], dtype=np.bool_)
+        for i in prange(xs.shape[0]):
+            px = xs[i]
+            py = ys[i]
+            inside = False
+            for k in range(ring_x.shape[0] - 1):
+                y1 = ring_y[k]
+                y2 = ring_y[k + 1]
+                if (y1 > py) != (y2 > py):
+                    x_cross = (ring_x[k + 1] - ring_x[k]) * (py - y1) / (y2 - y1) + ring_x[k]
+                    if px < x_cross:
+                        inside = not inside
+            out[i] = inside
+        return out
+else:
+    contains_ring = _contains_ring_numpy
+
+
+def contains_xy(polygon, xs, ys):
+    """
+    Test which (x, y) points fall inside a hole-free polygon
+
+    Args:
+        polygon (shapely.geometry.Polygon): Polygon in (lon, lat) order
+        xs (array-like): Point longitudes
+        ys (array-like): Point latitudes
+
+    Returns:
+        np.ndarray: Boolean mask, True where the point is inside
+    """
+    ring_x, ring_y = ring_arrays(polygon)
+    xs = np.ascontiguousarray(xs, dtype=np.float64)
+    ys = np.ascontiguousarray(ys, dtype=np.float64)
+    return contains_ring(xs, ys, ring_x, ring_y)
@@ -0,0 +1,25 @@
+"""
+Shared writers for tabular outputs saved under data/
+"""
+
+import os
+
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+
+def save_table(df, csv_path):
+    """
+    Write a frame as CSV with Arrow's C++ writer, plus a zstd Parquet copy
+
+    The Parquet file sits next to the CSV with the same stem, so readers
+    that prefer it keep the float columns binary instead of re-parsing text.
+
+    Args:
+        df (pd.DataFrame): Table to save
+        csv_path (str): Destination CSV path ending in '.csv'
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pacsv.write_csv(table, csv_path)
+    pq.write_table(table, os.path.splitext(csv_path)[0] + '.parquet', compression='zstd')